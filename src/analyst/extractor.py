@@ -18,9 +18,13 @@ import logging
 import math
 import random
 import re
+import sys
+import unicodedata
+from bisect import bisect_right
 import instructor
 import httpx
 from contextvars import ContextVar
+from functools import lru_cache
 from anthropic import Anthropic, APITimeoutError, APIError, RateLimitError
 from instructor.core import InstructorRetryException
 from typing import Optional, List, Set
@@ -238,7 +242,9 @@ def clear_extraction_stats() -> None:
         )
 
 
-from .schemas import DealExtraction, ArticleAnalysis, LeadStatus, RoundType, EnterpriseCategory
+from .schemas import (
+    DealExtraction, ArticleAnalysis, LeadStatus, RoundType, EnterpriseCategory, PenaltyBreakdown,
+)
 from ..config.settings import settings
 from ..config.funds import FUND_REGISTRY, FundConfig, EXTERNAL_ONLY_FUNDS
 # Note: match_fund_name is imported lazily in _verify_tracked_fund to avoid circular import
@@ -257,10 +263,26 @@ EXTERNAL_SOURCE_NAMES = frozenset({
 # (prompt says <0.35 = "Cannot verify as real funding" but threshold WAS 0.35)
 EXTERNAL_SOURCE_CONFIDENCE_THRESHOLD = 0.40
 
+# Confidence bands for health metrics: [0, 0.35) below_threshold, [0.35, 0.50) borderline,
+# [0.50, 0.65) medium, [0.65, 1.0] high. Lower edges are inclusive (bisect_right).
+CONFIDENCE_BAND_EDGES = (0.35, 0.50, 0.65)
+CONFIDENCE_BAND_NAMES = ("below_threshold", "borderline", "medium", "high")
+
+
+def confidence_band(score: float) -> str:
+    """Return the health-metric band name for a confidence score."""
+    return CONFIDENCE_BAND_NAMES[bisect_right(CONFIDENCE_BAND_EDGES, score)]
+
+
 # FIX #42: Initialize module-level constants from settings (not hardcoded)
 API_TIMEOUT_SECONDS = settings.llm_timeout
 MAX_RETRIES = settings.llm_max_retries
 
+# Hybrid re-extraction thresholds - read once (settings don't change at runtime)
+HYBRID_CONFIDENCE_MIN = settings.hybrid_confidence_min
+HYBRID_CONFIDENCE_MIN_EXTERNAL = settings.hybrid_confidence_min_external
+HYBRID_CONFIDENCE_MAX = settings.hybrid_confidence_max
+
 # Initialize Instructor with Anthropic client
 # FIX: Configure timeout at client level for reliable timeout handling
 _anthropic_client = Anthropic(
@@ -1997,7 +2019,7 @@ async def extract_deal(
             confidence_score=0.05,
             # FIX: Initialize extraction_confidence and penalty_breakdown for consistency
             extraction_confidence=0.05,
-            penalty_breakdown={},
+            penalty_breakdown=PenaltyBreakdown(),
             # NEW: Mark as not a new announcement
             is_new_announcement=False,
             announcement_evidence=None,
@@ -2033,7 +2055,7 @@ async def extract_deal(
             confidence_score=0.15,
             # FIX: Initialize extraction_confidence and penalty_breakdown for consistency
             extraction_confidence=0.15,
-            penalty_breakdown={},
+            penalty_breakdown=PenaltyBreakdown(),
             is_new_announcement=False,
             announcement_evidence=None,
             announcement_rejection_reason="Crypto/blockchain article - not an AI company",
@@ -2205,14 +2227,14 @@ async def extract_deal(
             # Only if: enabled, confidence in range, valid deal, has quality issues
             # FIX (2026-01): Different thresholds for internal vs external sources
             hybrid_min = (
-                settings.hybrid_confidence_min_external if is_external_source
-                else settings.hybrid_confidence_min
+                HYBRID_CONFIDENCE_MIN_EXTERNAL if is_external_source
+                else HYBRID_CONFIDENCE_MIN
             )
             if (
                 response
                 and settings.hybrid_extraction_enabled
                 and response.is_new_announcement
-                and hybrid_min <= response.confidence_score <= settings.hybrid_confidence_max
+                and hybrid_min <= response.confidence_score <= HYBRID_CONFIDENCE_MAX
                 and (response.lead_evidence_weak or len(response.founders) == 0)
             ):
                 logger.info(
@@ -2324,7 +2346,7 @@ async def extract_deal(
                 response
                 and settings.hybrid_extraction_enabled
                 and response.is_new_announcement
-                and response.confidence_score > settings.hybrid_confidence_max
+                and response.confidence_score > HYBRID_CONFIDENCE_MAX
                 and response.lead_evidence_weak
                 and response.tracked_fund_is_lead
             ):
@@ -2639,6 +2661,22 @@ async def extract_article(
     return None
 
 
+# Strong lead phrases (require word boundaries to avoid false positives),
+# compiled into one alternation so each text is scanned once
+_LEAD_LANGUAGE_PATTERN = re.compile(
+    r'\bled\s+by\b'           # 'led by'
+    r'|\bled\s+the\b'         # 'led the round'
+    r'|\bleads?\s+'            # 'lead ', 'leads '
+    r'|\bleading\b'            # 'leading'
+    r'|\bco-led\b'             # 'co-led'
+    r'|\bco-leads?\b'          # 'co-lead'
+    r'|\bheaded\s+by\b'       # 'headed by'
+    r'|\blead\s+investor\b'   # 'lead investor'
+    r'|\bspearheaded\b',       # 'spearheaded'
+    re.IGNORECASE,
+)
+
+
 def _has_lead_language(snippet: str, article_text: str = "") -> bool:
     """
     Check if text contains lead investor language.
@@ -2654,38 +2692,130 @@ def _has_lead_language(snippet: str, article_text: str = "") -> bool:
     Returns:
         True if lead status is proven, False otherwise.
     """
-    import re
+    # Check snippet first (cheap, higher weight); only scan the full article
+    # when the snippet is missing or lacks lead language
+    if snippet and _LEAD_LANGUAGE_PATTERN.search(snippet):
+        return True
+    if article_text and _LEAD_LANGUAGE_PATTERN.search(article_text):
+        return True
+    return False
 
-    # Combine snippet and article text for checking
-    # Check snippet first (higher weight), then article as fallback
-    texts_to_check = []
-    if snippet:
-        texts_to_check.append(snippet.lower())
-    if article_text:
-        texts_to_check.append(article_text.lower())
 
-    if not texts_to_check:
-        return False
+# Typographic punctuation that LLM output and press copy use inconsistently
+_MATCH_FOLD_TABLE = str.maketrans({
+    '\u2018': "'", '\u2019': "'", '\u201c': '"', '\u201d': '"',
+    '\u2013': '-', '\u2014': '-', '\u00a0': ' ',
+})
 
-    # Strong lead phrases (require word boundaries to avoid false positives)
-    lead_patterns = [
-        r'\bled\s+by\b',           # 'led by'
-        r'\bled\s+the\b',          # 'led the round'
-        r'\bleads?\s+',            # 'lead ', 'leads '
-        r'\bleading\b',            # 'leading'
-        r'\bco-led\b',             # 'co-led'
-        r'\bco-leads?\b',          # 'co-lead'
-        r'\bheaded\s+by\b',        # 'headed by'
-        r'\blead\s+investor\b',    # 'lead investor'
-        r'\bspearheaded\b',        # 'spearheaded'
-    ]
 
-    for text in texts_to_check:
-        for pattern in lead_patterns:
-            if re.search(pattern, text):
-                return True
+# Runs of non-ASCII characters - the only part of a string folding can change
+_NON_ASCII_RUN_PATTERN = re.compile(r'[^\x00-\x7f]+')
 
-    return False
+
+@lru_cache(maxsize=1)
+def _combining_delete_table() -> dict:
+    """
+    str.translate table deleting every Unicode combining mark (~900 code points).
+
+    Built on first non-ASCII fold rather than at import: the scan over all code
+    points takes ~0.1s and most articles never need it.
+    """
+    return {
+        cp: None for cp in range(sys.maxunicode + 1)
+        if unicodedata.combining(chr(cp))
+    }
+
+
+def _fold_for_matching(text: str) -> str:
+    """
+    Lowercase and fold text for name-vs-article matching.
+
+    Normalizes curly quotes/dashes and strips accents ("André" -> "andre") so
+    names match regardless of how the article or LLM rendered them. Non-Latin
+    characters are kept as-is. Call once per article and once per name, then
+    compare with plain substring/regex checks.
+    """
+    text = text.lower()
+    if text.isascii():
+        return text
+    # Press copy is mostly ASCII with a few "é"/"€"/"…": fold only the non-ASCII
+    # runs so the bulk of the article is never pushed through NFKD/translate
+    return _NON_ASCII_RUN_PATTERN.sub(_fold_non_ascii_run, text)
+
+
+def _fold_non_ascii_run(match: re.Match) -> str:
+    """re.sub callback for _fold_for_matching."""
+    return _fold_non_ascii(match.group())
+
+
+@lru_cache(maxsize=1024)
+def _fold_non_ascii(run: str) -> str:
+    """
+    Fold one run of non-ASCII characters.
+
+    Cached because the same few runs ("’", "“", "é", "€") repeat across an article.
+    """
+    run = run.translate(_MATCH_FOLD_TABLE)
+    # NFKD splits accents into combining marks; translate drops them in C
+    return unicodedata.normalize('NFKD', run).translate(_combining_delete_table())
+
+
+@lru_cache(maxsize=4)
+def _fold_article_for_matching(article_text: str) -> str:
+    """
+    _fold_for_matching for a whole article, cached for the current deal.
+
+    The investor and founder validators run on the same article_text object, and
+    str caches its own hash, so the second validator gets the folded text back
+    without re-folding (or re-hashing) the article.
+    """
+    return _fold_for_matching(article_text)
+
+
+@lru_cache(maxsize=256)
+def _investor_name_pattern(name: str) -> re.Pattern:
+    """
+    Compiled search pattern for an investor name or alias (cached per name).
+
+    The same few hundred fund names/aliases recur across every deal, so compile
+    each once instead of rebuilding the escaped pattern on every check.
+
+    Uses word boundary for short names (<8 chars) to prevent false positives.
+    Uses substring for longer names which are more distinctive.
+
+    FIX (2026-01): Excludes matches that are part of URLs to prevent false
+    positives like "GV" matching "gv.com" or "a16z" matching "a16z.com".
+    """
+    if len(name) < 8:
+        # Short names (GV, USV, Index, Accel) need word boundary
+        # FIX: Exclude URL patterns - don't match if preceded by . or / or followed by .com/.org/etc
+        # Pattern: name must NOT be preceded by [./] or followed by .[a-z]
+        return re.compile(rf'(?<![./])\b{re.escape(name)}\b(?!\.[a-z])')
+    # Longer names are distinctive enough for substring
+    # But still exclude URL patterns
+    return re.compile(rf'(?<![./]){re.escape(name)}(?!\.[a-z])')
+
+
+@lru_cache(maxsize=1)
+def _fund_alias_index() -> dict[str, tuple[str, ...]]:
+    """
+    Map each folded fund alias to every alias of the fund(s) it belongs to.
+
+    Built once on first use so _investor_in_text can resolve "a16z" ->
+    ("andreessen horowitz", "a16z bio", ...) with one dict lookup instead of
+    folding every alias of every fund per investor. Aliases go through
+    _fold_for_matching, the same fold applied to the investor name and article.
+    """
+    # Lazy import to avoid circular dependency
+    from ..harvester.fund_matcher import FUND_NAME_VARIANTS
+
+    index: dict[str, list[str]] = {}
+    for aliases in FUND_NAME_VARIANTS.values():
+        aliases_folded = [_fold_for_matching(a) for a in aliases]
+        for alias in aliases_folded:
+            bucket = index.setdefault(alias, [])
+            bucket.extend(a for a in aliases_folded if a not in bucket)
+    return {alias: tuple(bucket) for alias, bucket in index.items()}
 
 
 def _investor_in_text(investor_name: str, text_lower: str) -> bool:
@@ -2702,37 +2832,16 @@ def _investor_in_text(investor_name: str, text_lower: str) -> bool:
 
     Args:
         investor_name: The investor name to search for
-        text_lower: Lowercased article text
+        text_lower: Article text folded with _fold_for_matching (lowercased)
 
     Returns:
         True if investor appears in text (directly or via alias)
     """
-    import re
-    # Lazy import to avoid circular dependency
-    from ..harvester.fund_matcher import FUND_NAME_VARIANTS
-
-    inv_lower = investor_name.lower()
+    inv_lower = _fold_for_matching(investor_name)
 
     def _check_with_boundary(name: str, text: str) -> bool:
-        """Check if name appears in text with appropriate matching.
-
-        Uses word boundary for short names (<8 chars) to prevent false positives.
-        Uses substring for longer names which are more distinctive.
-
-        FIX (2026-01): Excludes matches that are part of URLs to prevent false
-        positives like "GV" matching "gv.com" or "a16z" matching "a16z.com".
-        """
-        if len(name) < 8:
-            # Short names (GV, USV, Index, Accel) need word boundary
-            # FIX: Exclude URL patterns - don't match if preceded by . or / or followed by .com/.org/etc
-            # Pattern: name must NOT be preceded by [./] or followed by .[a-z]
-            pattern = rf'(?<![./])\b{re.escape(name)}\b(?!\.[a-z])'
-            return bool(re.search(pattern, text))
-        else:
-            # Longer names are distinctive enough for substring
-            # But still exclude URL patterns
-            pattern = rf'(?<![./]){re.escape(name)}(?!\.[a-z])'
-            return bool(re.search(pattern, text))
+        """Check if name appears in text (see _investor_name_pattern for matching rules)."""
+        return _investor_name_pattern(name).search(text) is not None
 
     # Direct match (with word boundary for short names)
     if _check_with_boundary(inv_lower, text_lower):
@@ -2746,13 +2855,10 @@ def _investor_in_text(investor_name: str, text_lower: str) -> bool:
                 return True
 
     # Check known fund aliases (e.g., "a16z" ↔ "Andreessen Horowitz")
-    for fund_slug, aliases in FUND_NAME_VARIANTS.items():
-        # If investor matches any alias for this fund...
-        if inv_lower in [a.lower() for a in aliases]:
-            # ...check if ANY alias for this fund appears in text
-            for alias in aliases:
-                if _check_with_boundary(alias.lower(), text_lower):
-                    return True
+    # If investor matches any alias of a fund, check if ANY alias for that fund appears in text
+    for alias in _fund_alias_index().get(inv_lower, ()):
+        if _check_with_boundary(alias, text_lower):
+            return True
 
     return False
 
@@ -3052,6 +3158,11 @@ def _validate_round_type(deal: DealExtraction) -> DealExtraction:
     return deal
 
 
+def _clamp_confidence(score: float) -> float:
+    """Clamp a (finite) confidence score to [0, 1] after applying a penalty."""
+    return max(0.0, min(1.0, score))
+
+
 def _validate_confidence_score(deal: DealExtraction) -> DealExtraction:
     """
     Validate and clamp confidence score to valid range [0, 1].
@@ -3102,7 +3213,7 @@ def _validate_confidence_score(deal: DealExtraction) -> DealExtraction:
     deal.extraction_confidence = deal.confidence_score
 
     # Initialize penalty breakdown tracking
-    deal.penalty_breakdown = {}
+    deal.penalty_breakdown = PenaltyBreakdown()
 
     return deal
 
@@ -3126,12 +3237,12 @@ def _validate_founders_in_text(deal: DealExtraction, article_text: str) -> DealE
     if not article_text or not deal.founders:
         return deal
 
-    text_lower = article_text.lower()
+    text_lower = _fold_article_for_matching(article_text)
     validated_founders = []
     removed_founders = []
 
     for founder in deal.founders:
-        founder_name = founder.name.lower().strip() if founder.name else ""
+        founder_name = _fold_for_matching(founder.name).strip() if founder.name else ""
         if not founder_name:
             continue
 
@@ -3173,11 +3284,11 @@ def _validate_founders_in_text(deal: DealExtraction, article_text: str) -> DealE
         # - deal.founders=[] (no founders extracted) → no penalty
         # - deal.founders extracted but not in text → penalty per hallucinated name
         penalty = min(0.10, len(removed_founders) * 0.03)
-        deal.confidence_score = max(0.0, deal.confidence_score - penalty)
+        deal.confidence_score = _clamp_confidence(deal.confidence_score - penalty)
 
         # FIX 2026-01: Track penalty in breakdown for debugging/analytics
         if deal.penalty_breakdown is not None:
-            deal.penalty_breakdown["founders_removed"] = penalty
+            deal.penalty_breakdown.founders_removed = penalty
 
         logger.debug(
             f"Reduced confidence by {penalty:.2f} for {deal.startup_name} "
@@ -3207,13 +3318,25 @@ def _validate_investors_in_text(deal: DealExtraction, article_text: str) -> Deal
     if not article_text:
         return deal
 
-    text_lower = article_text.lower()
+    # Nothing to validate - skip lowercasing the article
+    if not deal.lead_investors and not deal.participating_investors:
+        return deal
+
+    text_lower = _fold_article_for_matching(article_text)
+
+    # Check each distinct name once - the same fund often appears in both lists
+    # (e.g., LLM lists a co-lead as participant too) and alias lookups are costly
+    name_present = {
+        name: _investor_in_text(name, text_lower)
+        for name in {inv.name for inv in deal.lead_investors}
+        | {inv.name for inv in deal.participating_investors}
+    }
 
     # Check lead investors
     validated_leads = []
     removed_leads = []
     for inv in deal.lead_investors:
-        if _investor_in_text(inv.name, text_lower):
+        if name_present[inv.name]:
             validated_leads.append(inv)
         else:
             removed_leads.append(inv.name)
@@ -3230,11 +3353,11 @@ def _validate_investors_in_text(deal: DealExtraction, article_text: str) -> Deal
         # FIX (2026-01): Reduce confidence when hallucinated investors are removed
         # Lead investors are more critical for deal validity, so larger penalty
         penalty = min(0.15, len(removed_leads) * 0.05)
-        deal.confidence_score = max(0.0, deal.confidence_score - penalty)
+        deal.confidence_score = _clamp_confidence(deal.confidence_score - penalty)
 
         # FIX 2026-01: Track penalty in breakdown for debugging/analytics
         if deal.penalty_breakdown is not None:
-            deal.penalty_breakdown["investors_removed"] = penalty
+            deal.penalty_breakdown.investors_removed = penalty
 
         logger.debug(
             f"Reduced confidence by {penalty:.2f} for {deal.startup_name} "
@@ -3251,7 +3374,7 @@ def _validate_investors_in_text(deal: DealExtraction, article_text: str) -> Deal
     validated_participants = []
     removed_participants = []
     for inv in deal.participating_investors:
-        if _investor_in_text(inv.name, text_lower):
+        if name_present[inv.name]:
             validated_participants.append(inv)
         else:
             removed_participants.append(inv.name)
@@ -3288,6 +3411,12 @@ def _verify_tracked_fund(deal: DealExtraction, article_text: str = "") -> DealEx
     This prevents false positives where the LLM claims lead status
     without proper evidence.
     """
+    # Fast path: no lead claim and no investors to match - nothing can change
+    # except clearing the evidence score (avoids lead-language regex scans)
+    if not deal.tracked_fund_is_lead and not deal.lead_investors and not deal.participating_investors:
+        deal.lead_evidence_score = None
+        return deal
+
     # Lazy import to avoid circular dependency
     from ..harvester.fund_matcher import match_fund_name
 
@@ -3323,11 +3452,11 @@ def _verify_tracked_fund(deal: DealExtraction, article_text: str = "") -> DealEx
         # Set to LIKELY_LEAD since Claude claimed lead but snippet lacks proof
         deal.tracked_fund_role = LeadStatus.LIKELY_LEAD
         # FIX (2026-01): Reduce confidence when lead evidence is weak
-        deal.confidence_score = max(0.0, deal.confidence_score - 0.08)
+        deal.confidence_score = _clamp_confidence(deal.confidence_score - 0.08)
 
         # FIX 2026-01: Track penalty in breakdown for debugging/analytics
         if deal.penalty_breakdown is not None:
-            deal.penalty_breakdown["weak_evidence"] = 0.08
+            deal.penalty_breakdown.weak_evidence = 0.08
 
     if deal.tracked_fund_is_lead and not deal.verification_snippet:
         logger.warning(
@@ -3339,11 +3468,11 @@ def _verify_tracked_fund(deal: DealExtraction, article_text: str = "") -> DealEx
         # Set to LIKELY_LEAD since Claude claimed lead but no snippet provided
         deal.tracked_fund_role = LeadStatus.LIKELY_LEAD
         # FIX (2026-01): Reduce confidence when lead evidence is weak
-        deal.confidence_score = max(0.0, deal.confidence_score - 0.08)
+        deal.confidence_score = _clamp_confidence(deal.confidence_score - 0.08)
 
         # FIX 2026-01: Track penalty in breakdown for debugging/analytics
         if deal.penalty_breakdown is not None:
-            deal.penalty_breakdown["weak_evidence"] = 0.08
+            deal.penalty_breakdown.weak_evidence = 0.08
 
     # FIX: Track ALL confirmed lead funds to record co-leads
     confirmed_lead_funds: list[tuple[str, str, str]] = []  # (slug, name, partner)
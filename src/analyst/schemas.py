@@ -5,6 +5,8 @@ These schemas enforce structured JSON output from the LLM.
 """
 
 from pydantic import BaseModel, Field, model_validator, field_validator
+from pydantic.json_schema import SkipJsonSchema
+from dataclasses import dataclass
 from typing import List, Optional
 from enum import Enum
 from datetime import date, timedelta
@@ -137,6 +139,14 @@ class ChainOfThought(BaseModel):
     )
 
 
+@dataclass(slots=True)
+class PenaltyBreakdown:
+    """Confidence penalties applied by post-extraction validators (0.0 = not applied)."""
+    founders_removed: float = 0.0
+    investors_removed: float = 0.0
+    weak_evidence: float = 0.0
+
+
 class DealExtraction(BaseModel):
     """
     Structured extraction of a funding deal from press release or news article.
@@ -345,9 +355,10 @@ class DealExtraction(BaseModel):
         ge=0.0, le=1.0,
         description="Final confidence score after penalties (0.0-1.0). Used for threshold decisions."
     )
-    penalty_breakdown: Optional[dict] = Field(
+    # Filled in by the post-extraction validators, never by the LLM - kept out of the prompt schema
+    penalty_breakdown: SkipJsonSchema[Optional[PenaltyBreakdown]] = Field(
         default=None,
-        description="Breakdown of penalties applied: {founders_removed: 0.03, investors_removed: 0.05, weak_evidence: 0.08}"
+        description="Breakdown of penalties applied (founders_removed, investors_removed, weak_evidence; 0.0 = not applied)"
     )
     # Note: thesis_drift_score removed - was never used in API/frontend
 
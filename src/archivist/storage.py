@@ -9,6 +9,7 @@ import logging
 from dataclasses import dataclass
 from datetime import datetime, date, timedelta, timezone
 from decimal import Decimal, ROUND_HALF_UP
+from functools import lru_cache
 from typing import Optional, Tuple
 from sqlalchemy import select, nullslast
 from sqlalchemy.dialects.postgresql import insert as pg_insert
@@ -72,32 +73,91 @@ COMPANY_NAME_MATCH_SUFFIXES = frozenset({
 })
 
 
+# Whole dedup normalization prefix/suffix handling in one anchored match: optional
+# "the " prefix, lazy core, then any run of COMPANY_NAME_SUFFIXES to the end.
+# The lazy core is the shortest prefix whose remainder is all suffixes, which is
+# the same result as repeatedly stripping the longest matching suffix.
+_DEDUP_NAME_PATTERN = re.compile(
+    r'(?:the )?(.*?)(?:'
+    + '|'.join(re.escape(s) for s in sorted(COMPANY_NAME_SUFFIXES, key=len, reverse=True))
+    + r')*',
+    re.DOTALL,
+)
+
+# Last two characters of every suffix (all are >= 2 chars). Most names end in
+# none of these, so they can skip the suffix match entirely.
+_COMPANY_SUFFIX_TAILS = frozenset(s[-2:] for s in COMPANY_NAME_SUFFIXES)
+
+
+# Dedup normalization keeps only [a-z0-9]. ASCII names (the common case) go through
+# a str.translate deletion table; anything else falls back to the compiled regex.
+_NON_ALNUM_PATTERN = re.compile(r'[^a-z0-9]')
+_ASCII_NON_ALNUM_DELETE = {
+    i: None for i in range(128)
+    if not (chr(i).isdigit() or 'a' <= chr(i) <= 'z')
+}
+
+
+@lru_cache(maxsize=65536)
 def _normalize_company_name_for_dedup(name: str) -> str:
     """
     Normalize company name for dedup key generation.
 
     Uses shared COMPANY_NAME_SUFFIXES constant (consolidated to prevent discrepancies).
 
+    Pure function, cached: the same company is keyed several times per deal
+    (dedup_key, amount_dedup_key, adjacent bucket keys) and recurs across articles.
+
     FIX (2026-01): Now strips ALL matching suffixes, not just one.
     Previous bug: "Acme Labs AI" → "Acme Labs" (only stripped " ai")
     Fixed: "Acme Labs AI" → "Acme" (strips " ai" then " labs")
     """
     name = name.lower().strip()
-    if name.startswith("the "):
-        name = name[4:]
+    if name[-2:] in _COMPANY_SUFFIX_TAILS:
+        # FIX: Strip ALL matching suffixes (not just one) - the pattern's suffix group repeats
+        name = _DEDUP_NAME_PATTERN.fullmatch(name).group(1)
+    else:
+        name = name.removeprefix("the ")
+
+    if name.isascii():
+        return name.translate(_ASCII_NON_ALNUM_DELETE)
+    return _NON_ALNUM_PATTERN.sub('', name)
+
+
+# Day 0 for dedup date buckets, as a proleptic ordinal (date.toordinal() avoids a timedelta per key)
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def _today_month_bucket() -> int:
+    """30-day bucket for today, used as the date component for deals without a date."""
+    return (date.today().toordinal() - _EPOCH_ORDINAL) // 30
+
+
+def _date_bucket_str(announced_date: Optional[date]) -> str:
+    """
+    Date component shared by dedup_key and amount_dedup_key.
+
+    Dated deals use 3-day buckets to catch near-duplicates (Jan 1-3 -> bucket 0,
+    Jan 4-6 -> bucket 1, ...). Deals without a date use "nodate" + the current
+    30-day bucket, which catches race condition duplicates created within the
+    same ~30-day period.
+    FIX (2026-01 Optimist bug): Changed from weekly to monthly to reduce edge case duplicates
+    """
+    if announced_date:
+        return str((announced_date.toordinal() - _EPOCH_ORDINAL) // 3)
+    return f"nodate_{_today_month_bucket()}"
 
-    # FIX: Strip ALL matching suffixes (not just one)
-    # Loop until no more suffixes match
-    changed = True
-    while changed:
-        changed = False
-        for suffix in COMPANY_NAME_SUFFIXES:
-            if name.endswith(suffix):
-                name = name[:-len(suffix)]
-                changed = True
-                break  # Restart loop to check for more suffixes
 
-    return re.sub(r'[^a-z0-9]', '', name)
+def _dedup_hash(key_data: str) -> str:
+    """
+    Hash dedup key material to a 32-char hex digest.
+
+    Stays MD5 so keys match the values already stored under the unique index on
+    deals.dedup_key (switching algorithms would need a full re-key migration).
+    usedforsecurity=False skips OpenSSL's security-policy path, which makes MD5 as
+    fast as BLAKE2b for these short inputs, and keeps it usable on FIPS hosts.
+    """
+    return hashlib.md5(key_data.encode(), usedforsecurity=False).hexdigest()
 
 
 def make_dedup_key(company_name: str, round_type: str, announced_date: Optional[date]) -> str:
@@ -118,23 +178,22 @@ def make_dedup_key(company_name: str, round_type: str, announced_date: Optional[
     # normalize_company_name is defined later in this file
     normalized_name = _normalize_company_name_for_dedup(company_name)
 
-    # Round date to 3-day buckets to catch near-duplicates
-    # e.g., Jan 1-3 all map to bucket 0, Jan 4-6 to bucket 1, etc.
-    if announced_date:
-        # Use days since epoch, rounded to 3-day buckets
-        days_since_epoch = (announced_date - date(1970, 1, 1)).days
-        date_bucket = days_since_epoch // 3
-        date_str = str(date_bucket)
-    else:
-        # For deals without dates, use "nodate" + current month bucket
-        # This catches race condition duplicates created within the same ~30-day period
-        # FIX (2026-01 Optimist bug): Changed from weekly to monthly to reduce edge case duplicates
-        today = date.today()
-        month_bucket = (today - date(1970, 1, 1)).days // 30
-        date_str = f"nodate_{month_bucket}"
+    return _dedup_hash(f"{normalized_name}|{round_type}|{_date_bucket_str(announced_date)}")
 
-    key_data = f"{normalized_name}|{round_type}|{date_str}"
-    return hashlib.md5(key_data.encode()).hexdigest()
+
+def _amount_bucket(amount_usd: int) -> int:
+    """Logarithmic amount bucket used in the amount dedup key (see make_amount_dedup_key)."""
+    # NOTE: Tier edges are decimal, so bit_length() can't index them; a bisect
+    # over a (base, step) table benchmarked ~13% slower than this cascade.
+    if amount_usd < 1_000_000:  # $250K-$1M (early-stage)
+        return amount_usd // 250_000  # $250K increments
+    if amount_usd < 10_000_000:  # $1M-$10M
+        return 4 + (amount_usd // 2_000_000)  # $2M increments, offset by 4
+    if amount_usd < 100_000_000:  # $10M-$100M
+        return 9 + (amount_usd // 20_000_000)  # $20M increments, offset by 9
+    if amount_usd < 1_000_000_000:  # $100M-$1B
+        return 14 + (amount_usd // 100_000_000)  # $100M increments, offset by 14
+    return 24 + (amount_usd // 500_000_000)  # >$1B: $500M increments, offset by 24
 
 
 def make_amount_dedup_key(company_name: str, amount_usd: Optional[int], announced_date: Optional[date]) -> Optional[str]:
@@ -169,32 +228,10 @@ def make_amount_dedup_key(company_name: str, amount_usd: Optional[int], announce
         return None
 
     normalized_name = _normalize_company_name_for_dedup(company_name)
-
-    # Calculate amount bucket (logarithmic buckets)
-    if amount_usd < 1_000_000:  # $250K-$1M (early-stage)
-        amount_bucket = amount_usd // 250_000  # $250K increments
-    elif amount_usd < 10_000_000:  # $1M-$10M
-        amount_bucket = 4 + (amount_usd // 2_000_000)  # $2M increments, offset by 4
-    elif amount_usd < 100_000_000:  # $10M-$100M
-        amount_bucket = 9 + (amount_usd // 20_000_000)  # $20M increments, offset by 9
-    elif amount_usd < 1_000_000_000:  # $100M-$1B
-        amount_bucket = 14 + (amount_usd // 100_000_000)  # $100M increments, offset by 14
-    else:  # >$1B
-        amount_bucket = 24 + (amount_usd // 500_000_000)  # $500M increments, offset by 24
+    amount_bucket = _amount_bucket(amount_usd)
 
     # Date bucket (same as dedup_key)
-    if announced_date:
-        days_since_epoch = (announced_date - date(1970, 1, 1)).days
-        date_bucket = days_since_epoch // 3
-        date_str = str(date_bucket)
-    else:
-        # FIX (2026-01 Optimist bug): Changed from weekly to monthly bucket for consistency
-        today = date.today()
-        month_bucket = (today - date(1970, 1, 1)).days // 30
-        date_str = f"nodate_{month_bucket}"
-
-    key_data = f"{normalized_name}|amt{amount_bucket}|{date_str}"
-    return hashlib.md5(key_data.encode()).hexdigest()
+    return _dedup_hash(f"{normalized_name}|amt{amount_bucket}|{_date_bucket_str(announced_date)}")
 
 
 def get_adjacent_bucket_keys(company_name: str, round_type: str, announced_date: Optional[date]) -> list[str]:
@@ -214,30 +251,41 @@ def get_adjacent_bucket_keys(company_name: str, round_type: str, announced_date:
         List of dedup_keys for adjacent buckets (typically 2 keys for ±1 bucket)
     """
     normalized_name = _normalize_company_name_for_dedup(company_name)
-    adjacent_keys = []
 
+    # Same bucketing as _date_bucket_str(), offset by ±1
     if announced_date:
-        days_since_epoch = (announced_date - date(1970, 1, 1)).days
-        primary_bucket = days_since_epoch // 3
-        for bucket_offset in [-1, 1]:
-            adjacent_bucket = primary_bucket + bucket_offset
-            key_data = f"{normalized_name}|{round_type}|{adjacent_bucket}"
-            adjacent_keys.append(hashlib.md5(key_data.encode()).hexdigest())
+        date_prefix = ""
+        primary_bucket = (announced_date.toordinal() - _EPOCH_ORDINAL) // 3
     else:
-        today = date.today()
-        primary_month_bucket = (today - date(1970, 1, 1)).days // 30
-        for bucket_offset in [-1, 1]:
-            adjacent_bucket = primary_month_bucket + bucket_offset
-            key_data = f"{normalized_name}|{round_type}|nodate_{adjacent_bucket}"
-            adjacent_keys.append(hashlib.md5(key_data.encode()).hexdigest())
+        date_prefix = "nodate_"
+        primary_bucket = _today_month_bucket()
 
-    return adjacent_keys
+    return [
+        _dedup_hash(f"{normalized_name}|{round_type}|{date_prefix}{primary_bucket + bucket_offset}")
+        for bucket_offset in (-1, 1)
+    ]
 
 
 # ----- URL Validation (FIX #1: Use shared module) -----
 from ..common.url_utils import is_valid_url as _is_valid_url, sanitize_url as _sanitize_url
 
 
+# Placeholder values that indicate no real amount (see _is_valid_amount)
+_AMOUNT_PLACEHOLDERS = frozenset({
+    "<unknown>",
+    "unknown",
+    "none",
+    "null",
+    "undisclosed",
+    "not disclosed",
+    "n/a",
+    "na",
+    "tbd",
+    "confidential",
+    "",
+})
+
+
 def _is_valid_amount(amount: Optional[str]) -> bool:
     """
     Check if amount string is a valid funding amount (not a placeholder).
@@ -254,26 +302,11 @@ def _is_valid_amount(amount: Optional[str]) -> bool:
 
     amount_lower = amount.lower().strip()
 
-    # List of placeholder values that indicate no real amount
-    placeholders = {
-        "<unknown>",
-        "unknown",
-        "none",
-        "null",
-        "undisclosed",
-        "not disclosed",
-        "n/a",
-        "na",
-        "tbd",
-        "confidential",
-        "",
-    }
-
-    if amount_lower in placeholders:
+    if amount_lower in _AMOUNT_PLACEHOLDERS:
         return False
 
     # Check for partial matches (e.g., "amount undisclosed")
-    if any(p in amount_lower for p in ["unknown", "undisclosed", "not disclosed"]):
+    if any(p in amount_lower for p in ("unknown", "undisclosed", "not disclosed")):
         return False
 
     # Valid amount should have a number
@@ -336,11 +369,34 @@ from ..analyst.schemas import DealExtraction, LeadStatus, EnterpriseCategory
 from ..config.funds import FUND_REGISTRY
 # NOTE: fund_matcher import moved inside save_deal() to avoid circular import
 
+# Base (deal, company) query shared by every find_duplicate_deal tier. Select is
+# immutable - .where()/.limit() return copies - so building the join once saves
+# re-constructing it per tier on every call.
+_DEAL_WITH_COMPANY_SELECT = (
+    select(Deal, PortfolioCompany)
+    .join(PortfolioCompany, Deal.company_id == PortfolioCompany.id)
+)
+
+
+# normalize_amount patterns, compiled once (see the step-by-step comments there)
+_AMOUNT_CURRENCY_PREFIX_PATTERN = re.compile(r'^(usd|us|eur|gbp|inr)\s*')
+_AMOUNT_APPROX_PREFIX_PATTERN = re.compile(
+    r'^(approximately|approx\.?|around|about|up\s+to|nearly|over|more\s+than|less\s+than|~)\s*'
+)
+_AMOUNT_RANGE_PATTERN = re.compile(r'(\d+)\s*[-–—to]+\s*\d+')
+_AMOUNT_VALUE_PATTERN = re.compile(
+    r'([\d.]+)\s*(million|mn|mm|m|billion|bn|b|thousand|k|crore|cr|lakh|lac)?'
+)
+
 
+@lru_cache(maxsize=8192)
 def normalize_amount(amount_str: Optional[str]) -> Optional[int]:
     """
     Normalize amount string to integer (in USD equivalent).
 
+    Pure function, cached: the same amount strings recur across tiers, save
+    paths and sources reporting the same deal.
+
     Examples:
         "$30M" → 30000000
         "$30 million" → 30000000
@@ -362,10 +418,10 @@ def normalize_amount(amount_str: Optional[str]) -> Optional[int]:
 
     # Remove currency prefixes (including "US $" which becomes "us " after $ removal)
     # Note: longer matches must come first (usd before us) due to regex alternation
-    clean = re.sub(r'^(usd|us|eur|gbp|inr)\s*', '', clean)
+    clean = _AMOUNT_CURRENCY_PREFIX_PATTERN.sub('', clean)
 
     # FIX: Remove approximate/range prefixes that LLM might include
-    clean = re.sub(r'^(approximately|approx\.?|around|about|up\s+to|nearly|over|more\s+than|less\s+than|~)\s*', '', clean)
+    clean = _AMOUNT_APPROX_PREFIX_PATTERN.sub('', clean)
 
     # Handle "undisclosed" or similar
     if "undisclosed" in clean or "unknown" in clean or "<unknown>" in clean:
@@ -373,12 +429,12 @@ def normalize_amount(amount_str: Optional[str]) -> Optional[int]:
 
     # Handle ranges like "25-30 million" - take the first number
     # Also handles "25 to 30 million"
-    clean = re.sub(r'(\d+)\s*[-–—to]+\s*\d+', r'\1', clean)
+    clean = _AMOUNT_RANGE_PATTERN.sub(r'\1', clean)
 
     # Extract number and multiplier
     # Added "mn" as alternative for million (common in some sources)
     # Added "cr" and "crore" for Indian currency (1 crore ≈ $120K USD)
-    match = re.match(r'([\d.]+)\s*(million|mn|mm|m|billion|bn|b|thousand|k|crore|cr|lakh|lac)?', clean)
+    match = _AMOUNT_VALUE_PATTERN.match(clean)
     if not match:
         return None
 
@@ -492,28 +548,9 @@ def normalize_company_name(name: str) -> str:
         "Anthropic, Inc." → "anthropic"
         "Acme Labs AI" → "acme"  # FIX: Now strips both suffixes
     """
-    # Lowercase first
-    name = name.lower().strip()
-
-    # Remove "the" prefix (common in company names)
-    if name.startswith("the "):
-        name = name[4:]
-
-    # FIX: Remove ALL matching suffixes (not just one)
-    # Loop until no more suffixes match
-    changed = True
-    while changed:
-        changed = False
-        for suffix in COMPANY_NAME_SUFFIXES:
-            if name.endswith(suffix):
-                name = name[:-len(suffix)]
-                changed = True
-                break  # Restart loop to check for more suffixes
-
-    # Remove non-alphanumeric characters
-    name = re.sub(r'[^a-z0-9]', '', name)
-
-    return name
+    # Same rules as the dedup key normalization (one anchored suffix regex,
+    # ASCII translate table), so the two can never drift apart
+    return _normalize_company_name_for_dedup(name)
 
 
 def company_names_match(name1: str, name2: str) -> bool:
@@ -530,7 +567,19 @@ def company_names_match(name1: str, name2: str) -> bool:
         ("Glean", "Glean AI") → True  (ai is a known suffix)
         ("Amazon", "Amazonia") → False  (ia is not a known suffix)
     """
-    norm1 = normalize_company_name(name1)
+    return _company_names_match_normalized(name1, normalize_company_name(name1), name2)
+
+
+@lru_cache(maxsize=8192)
+def _company_names_match_normalized(name1: str, norm1: str, name2: str) -> bool:
+    """
+    company_names_match() with name1 already normalized.
+
+    find_duplicate_deal() compares one incoming name against many candidate rows,
+    so it normalizes the incoming name once and only normalizes each candidate.
+    Cached: the same candidate rows come back from several tiers in one call, and
+    the same company pairs recur across articles about one deal.
+    """
     norm2 = normalize_company_name(name2)
 
     # Exact match after normalization
@@ -775,6 +824,28 @@ async def get_or_create_fund(session: AsyncSession, slug: str) -> Optional[Fund]
     return fund
 
 
+def _tier25_amounts_conflict(amount_a: int, amount_b: int) -> bool:
+    """
+    TIER 2.5 amount sanity check: True if the two amounts are too far apart to be one deal.
+
+    FIX (2026-01): Prevents $100M Series B being merged with $500M valuation as same deal.
+    Amounts more than 5x apart conflict, UNLESS it's the classic valuation pattern:
+    - Ratio is 8-12x (funding vs valuation is typically 10x)
+    - Both amounts are significant (smaller >= $50M, larger >= $400M)
+
+    Ratios are compared by cross-multiplying, so no float division per candidate.
+    """
+    larger, smaller = (amount_a, amount_b) if amount_a >= amount_b else (amount_b, amount_a)
+    if larger <= 5 * max(1, smaller):
+        return False
+    is_valuation_pattern = (
+        smaller >= 50_000_000 and
+        larger >= 400_000_000 and
+        8 * smaller <= larger <= 12 * smaller
+    )
+    return not is_valuation_pattern
+
+
 async def find_duplicate_deal(
     session: AsyncSession,
     company_name: str,
@@ -831,17 +902,22 @@ async def find_duplicate_deal(
     - TIER 0 uses exact company name + round + date window (most aggressive)
     - TIER 4 uses exact amount+date+round for prefix name matching
     - TIER 3 uses targeted amount_usd filter for efficient matching
-    - TIER 2 uses targeted date+company query (FIX: no LIMIT, prevents missed dupes)
-    - TIER 2.5 uses round_type + date window for amount-agnostic matching
+    - TIER 2 uses one same-day query for exact then fuzzy names (FIX: no LIMIT, prevents missed dupes)
+    - TIER 2.5 uses round_type + date window for amount-agnostic matching (same query
+      also returns the NULL-date REVERSE candidates)
     - TIER 1 uses general query with LIMIT 200
     - Date fallback for deals without announced_date
     """
     from sqlalchemy import or_, func, and_
 
-    # Normalize inputs for comparison
+    # Normalize inputs once - every tier compares against these
     normalized_amount = normalize_amount(amount)
     normalized_company = normalize_company_name(company_name)
 
+    # Read the clock once - every tier's recency cutoff is relative to these
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    today = date.today()
+
     # =========================================================================
     # TIER 0 (NEW): Exact company name + same round + date within ±5 days
     # This is the most aggressive tier to catch race condition duplicates.
@@ -851,8 +927,7 @@ async def find_duplicate_deal(
     # FIX (2026-01 Optimist bug): Expanded from ±3 to ±5 days to catch bucket boundaries
     # =========================================================================
     tier0_stmt = (
-        select(Deal, PortfolioCompany)
-        .join(PortfolioCompany, Deal.company_id == PortfolioCompany.id)
+        _DEAL_WITH_COMPANY_SELECT
         .where(func.lower(PortfolioCompany.name) == company_name.lower().strip())
         .where(Deal.round_type == round_type)
     )
@@ -870,18 +945,18 @@ async def find_duplicate_deal(
                 # FIX (2026-01): Expanded from 7 to 10 days for null-date deals
                 and_(
                     Deal.announced_date.is_(None),
-                    Deal.created_at >= (datetime.now(timezone.utc) - timedelta(days=10)).replace(tzinfo=None)
+                    Deal.created_at >= now - timedelta(days=10)
                 )
             )
         )
     else:
         # No date provided: match recent deals with null date or recent dates
         # FIX (2026-01): Expanded from 14 to 21 days for incoming null-date deals
-        recent_cutoff_dt = (datetime.now(timezone.utc) - timedelta(days=21)).replace(tzinfo=None)
+        recent_cutoff_dt = now - timedelta(days=21)
         tier0_stmt = tier0_stmt.where(
             or_(
                 Deal.announced_date.is_(None),
-                Deal.announced_date >= (date.today() - timedelta(days=21))
+                Deal.announced_date >= (today - timedelta(days=21))
             )
         ).where(Deal.created_at >= recent_cutoff_dt)
 
@@ -902,14 +977,14 @@ async def find_duplicate_deal(
     # the same prefix but have different suffixes not in our known list.
     # Very high confidence: exact amount + exact date + same round = same deal.
     # =========================================================================
-    if normalized_amount and announced_date:
+    # Names shorter than 3 chars can never satisfy the prefix check, so skip the query
+    if normalized_amount and announced_date and len(normalized_company) >= 3:
         # Very tight tolerance (5%) for this tier since we're relaxing name match
-        amount_low = int(normalized_amount * 0.95)
-        amount_high = int(normalized_amount * 1.05)
+        amount_low = normalized_amount * 95 // 100
+        amount_high = normalized_amount * 105 // 100
 
         tier4_stmt = (
-            select(Deal, PortfolioCompany)
-            .join(PortfolioCompany, Deal.company_id == PortfolioCompany.id)
+            _DEAL_WITH_COMPANY_SELECT
             .where(Deal.amount_usd.between(amount_low, amount_high))
             .where(Deal.announced_date == announced_date)
             .where(Deal.round_type == round_type)
@@ -921,7 +996,7 @@ async def find_duplicate_deal(
             existing_normalized = normalize_company_name(company.name)
             # FIX: Require at least 60% prefix overlap (not just 3 chars)
             # This prevents false matches like "MEQ Probe" vs "MEQ Consulting"
-            if len(normalized_company) >= 3 and len(existing_normalized) >= 3:
+            if len(existing_normalized) >= 3:
                 shorter_len = min(len(normalized_company), len(existing_normalized))
                 # FIX 2026-01: Require minimum 4-char absolute prefix to prevent false matches
                 # on short names like "MEQ" vs "MES" (was max(3, ...) which failed for 3-char names)
@@ -949,13 +1024,12 @@ async def find_duplicate_deal(
     # Uses amount_usd column for SQL filtering before Python name matching
     # =========================================================================
     if normalized_amount:
-        # Calculate 10% tolerance range for SQL WHERE clause
-        amount_low = int(normalized_amount * 0.90)
-        amount_high = int(normalized_amount * 1.10)
+        # Calculate 10% tolerance range for SQL WHERE clause (integer math, no float rounding)
+        amount_low = normalized_amount * 90 // 100
+        amount_high = normalized_amount * 110 // 100
 
         tier3_stmt = (
-            select(Deal, PortfolioCompany)
-            .join(PortfolioCompany, Deal.company_id == PortfolioCompany.id)
+            _DEAL_WITH_COMPANY_SELECT
             .where(Deal.amount_usd.between(amount_low, amount_high))
         )
 
@@ -963,7 +1037,7 @@ async def find_duplicate_deal(
         if announced_date:
             date_start = announced_date - timedelta(days=30)
             date_end = announced_date + timedelta(days=30)
-            recent_cutoff_dt = (datetime.now(timezone.utc) - timedelta(days=60)).replace(tzinfo=None)
+            recent_cutoff_dt = now - timedelta(days=60)
             tier3_stmt = tier3_stmt.where(
                 or_(
                     Deal.announced_date.between(date_start, date_end),
@@ -972,10 +1046,10 @@ async def find_duplicate_deal(
             )
         else:
             # No date: only check recent deals (last 60 days)
-            recent_cutoff_dt = (datetime.now(timezone.utc) - timedelta(days=60)).replace(tzinfo=None)
+            recent_cutoff_dt = now - timedelta(days=60)
             tier3_stmt = tier3_stmt.where(
                 or_(
-                    Deal.announced_date >= (date.today() - timedelta(days=60)),
+                    Deal.announced_date >= (today - timedelta(days=60)),
                     (Deal.announced_date.is_(None) & (Deal.created_at >= recent_cutoff_dt))
                 )
             )
@@ -985,7 +1059,7 @@ async def find_duplicate_deal(
         tier3_candidates = tier3_result.all()
 
         for deal, company in tier3_candidates:
-            if company_names_match(company_name, company.name):
+            if _company_names_match_normalized(company_name, normalized_company, company.name):
                 logger.info(
                     f"Found duplicate deal (TIER 3 cross-round): '{company_name}' {round_type} "
                     f"matches '{company.name}' {deal.round_type} "
@@ -994,41 +1068,34 @@ async def find_duplicate_deal(
                 return deal
 
     # =========================================================================
-    # TIER 2 TARGETED: Same-day exact match (prevents LIMIT 200 bug)
-    # This runs a focused query for exact date + normalized company name match
-    # to avoid missing duplicates when deal count exceeds LIMIT
+    # TIER 2: Same-day match (no LIMIT - prevents LIMIT 200 bug)
+    # OPTIMIZED: One same-day query serves both passes. Exact-name rows are a
+    # subset of the same-day rows, so the exact pass runs first in Python and
+    # the fuzzy pass second, with the same precedence as two separate queries.
     # =========================================================================
     if announced_date:
         tier2_stmt = (
-            select(Deal, PortfolioCompany)
-            .join(PortfolioCompany, Deal.company_id == PortfolioCompany.id)
+            _DEAL_WITH_COMPANY_SELECT
             .where(Deal.announced_date == announced_date)
-            .where(func.lower(PortfolioCompany.name) == company_name.lower().strip())
         )
         tier2_result = await session.execute(tier2_stmt)
         tier2_candidates = tier2_result.all()
 
+        company_name_lower = company_name.lower().strip()
         for deal, company in tier2_candidates:
-            # Direct match - same date and exact company name
-            logger.info(
-                f"Found same-day duplicate (TIER 2 targeted): '{company_name}' matches '{company.name}' "
-                f"(deal #{deal.id}, {deal.round_type}, {deal.amount}, date={deal.announced_date})"
-            )
-            return deal
+            if company.name.lower() == company_name_lower:
+                # Direct match - same date and exact company name
+                logger.info(
+                    f"Found same-day duplicate (TIER 2 targeted): '{company_name}' matches '{company.name}' "
+                    f"(deal #{deal.id}, {deal.round_type}, {deal.amount}, date={deal.announced_date})"
+                )
+                return deal
 
         # Also check with company_names_match for fuzzy match on same day
         # FIX: Use company_names_match() instead of exact normalized comparison
         # This catches "Leona" vs "Leona Health" where 'health' is a known suffix
-        tier2_fuzzy_stmt = (
-            select(Deal, PortfolioCompany)
-            .join(PortfolioCompany, Deal.company_id == PortfolioCompany.id)
-            .where(Deal.announced_date == announced_date)
-        )
-        tier2_fuzzy_result = await session.execute(tier2_fuzzy_stmt)
-        tier2_fuzzy_candidates = tier2_fuzzy_result.all()
-
-        for deal, company in tier2_fuzzy_candidates:
-            if company_names_match(company_name, company.name):
+        for deal, company in tier2_candidates:
+            if _company_names_match_normalized(company_name, normalized_company, company.name):
                 logger.info(
                     f"Found same-day duplicate (TIER 2 fuzzy): '{company_name}' matches '{company.name}' "
                     f"(deal #{deal.id}, {deal.round_type}, {deal.amount}, date={deal.announced_date})"
@@ -1044,45 +1111,43 @@ async def find_duplicate_deal(
     # Emergent Series B where one source reported Jan 1 and another Jan 20.
     # For the SAME round type, it's extremely rare to have two separate rounds
     # within 30 days - this is almost always the same deal with different dates.
+    #
+    # OPTIMIZED: The same query also fetches the TIER 2.5 REVERSE candidates
+    # (existing deal has NULL date); they are checked after the dated rows.
     # =========================================================================
     if announced_date:
         tier25_stmt = (
-            select(Deal, PortfolioCompany)
-            .join(PortfolioCompany, Deal.company_id == PortfolioCompany.id)
+            _DEAL_WITH_COMPANY_SELECT
             .where(Deal.round_type == round_type)
-            .where(Deal.announced_date.between(
-                announced_date - timedelta(days=30),
-                announced_date + timedelta(days=30)
+            .where(or_(
+                Deal.announced_date.between(
+                    announced_date - timedelta(days=30),
+                    announced_date + timedelta(days=30)
+                ),
+                and_(
+                    Deal.announced_date.is_(None),
+                    Deal.created_at >= now - timedelta(days=30)
+                )
             ))
         )
         tier25_result = await session.execute(tier25_stmt)
         tier25_candidates = tier25_result.all()
 
         for deal, company in tier25_candidates:
-            if company_names_match(company_name, company.name):
+            if deal.announced_date is None:
+                continue  # TIER 2.5 REVERSE candidate, checked below
+            if _company_names_match_normalized(company_name, normalized_company, company.name):
                 # FIX (2026-01): Stricter amount sanity check for TIER 2.5
-                # Prevents $100M Series B being merged with $500M valuation as same deal
-                # Valuation confusion exception now requires:
-                # 1. Ratio must be ~10x (classic funding/valuation pattern)
-                # 2. BOTH amounts must be >= $50M (typical for valuation mentions)
-                if normalized_amount and deal.amount_usd:
-                    larger_amount = max(normalized_amount, deal.amount_usd)
-                    smaller_amount = min(normalized_amount, deal.amount_usd)
-                    ratio = larger_amount / max(1, smaller_amount)
-                    # Skip match if ratio > 5x, UNLESS it's the classic valuation pattern:
-                    # - Ratio is 8-12x (funding vs valuation is typically 10x)
-                    # - Both amounts are significant ($50M+ each)
-                    is_valuation_pattern = (
-                        8.0 <= ratio <= 12.0 and
-                        smaller_amount >= 50_000_000 and
-                        larger_amount >= 400_000_000
+                # (see _tier25_amounts_conflict for the valuation confusion exception)
+                if (
+                    normalized_amount and deal.amount_usd
+                    and _tier25_amounts_conflict(normalized_amount, deal.amount_usd)
+                ):
+                    logger.debug(
+                        f"TIER 2.5 skip: '{company_name}' amounts too far apart "
+                        f"(incoming={normalized_amount}, existing={deal.amount_usd})"
                     )
-                    if ratio > 5 and not is_valuation_pattern:
-                        logger.debug(
-                            f"TIER 2.5 skip: '{company_name}' amount ratio {ratio:.1f}x too high "
-                            f"(incoming={normalized_amount}, existing={deal.amount_usd})"
-                        )
-                        continue
+                    continue
                 logger.warning(
                     f"Found duplicate (TIER 2.5 round+date ±30d): '{company_name}' {round_type} "
                     f"matches '{company.name}' {deal.round_type} (deal #{deal.id}, "
@@ -1091,13 +1156,38 @@ async def find_duplicate_deal(
                     f"- same round type within 30 days"
                 )
                 return deal
+
+        # TIER 2.5 REVERSE: Incoming has date, existing has NULL date
+        # FIX (2026-01 Optimist bug): Catches existing deal with NULL date when incoming has a date.
+        # This handles cases where the first article didn't have a date, but subsequent articles do.
+        for deal, company in tier25_candidates:
+            if deal.announced_date is not None:
+                continue
+            if _company_names_match_normalized(company_name, normalized_company, company.name):
+                # FIX (2026-01): Apply same stricter amount sanity check
+                if (
+                    normalized_amount and deal.amount_usd
+                    and _tier25_amounts_conflict(normalized_amount, deal.amount_usd)
+                ):
+                    logger.debug(
+                        f"TIER 2.5 reverse skip: '{company_name}' amounts too far apart "
+                        f"(incoming={normalized_amount}, existing={deal.amount_usd})"
+                    )
+                    continue
+                logger.warning(
+                    f"Found duplicate (TIER 2.5 reverse): '{company_name}' {round_type} "
+                    f"matches '{company.name}' {deal.round_type} (deal #{deal.id}, "
+                    f"amounts: incoming={amount}, existing={deal.amount}, "
+                    f"dates: incoming={announced_date}, existing=NULL) "
+                    f"- existing deal has NULL date, incoming has date"
+                )
+                return deal
     else:
         # FIX: Null-date handling for TIER 2.5
         # For null-date deals, check recent deals with same round (last 30 days by created_at)
-        recent_cutoff_dt = (datetime.now(timezone.utc) - timedelta(days=30)).replace(tzinfo=None)
+        recent_cutoff_dt = now - timedelta(days=30)
         tier25_null_stmt = (
-            select(Deal, PortfolioCompany)
-            .join(PortfolioCompany, Deal.company_id == PortfolioCompany.id)
+            _DEAL_WITH_COMPANY_SELECT
             .where(Deal.round_type == round_type)
             .where(Deal.created_at >= recent_cutoff_dt)
         )
@@ -1105,22 +1195,17 @@ async def find_duplicate_deal(
         tier25_null_candidates = tier25_null_result.all()
 
         for deal, company in tier25_null_candidates:
-            if company_names_match(company_name, company.name):
+            if _company_names_match_normalized(company_name, normalized_company, company.name):
                 # FIX (2026-01): Apply same stricter amount sanity check
-                if normalized_amount and deal.amount_usd:
-                    larger_amount = max(normalized_amount, deal.amount_usd)
-                    smaller_amount = min(normalized_amount, deal.amount_usd)
-                    ratio = larger_amount / max(1, smaller_amount)
-                    is_valuation_pattern = (
-                        8.0 <= ratio <= 12.0 and
-                        smaller_amount >= 50_000_000 and
-                        larger_amount >= 400_000_000
+                if (
+                    normalized_amount and deal.amount_usd
+                    and _tier25_amounts_conflict(normalized_amount, deal.amount_usd)
+                ):
+                    logger.debug(
+                        f"TIER 2.5 null-date skip: '{company_name}' amounts too far apart "
+                        f"(incoming={normalized_amount}, existing={deal.amount_usd})"
                     )
-                    if ratio > 5 and not is_valuation_pattern:
-                        logger.debug(
-                            f"TIER 2.5 null-date skip: '{company_name}' amount ratio {ratio:.1f}x too high"
-                        )
-                        continue
+                    continue
                 logger.warning(
                     f"Found duplicate (TIER 2.5 null-date): '{company_name}' {round_type} "
                     f"matches '{company.name}' {deal.round_type} (deal #{deal.id}, "
@@ -1129,55 +1214,12 @@ async def find_duplicate_deal(
                 )
                 return deal
 
-    # =========================================================================
-    # TIER 2.5 REVERSE: Incoming has date, existing has NULL date
-    # FIX (2026-01 Optimist bug): Catches existing deal with NULL date when incoming has a date.
-    # This handles cases where the first article didn't have a date, but subsequent articles do.
-    # =========================================================================
-    if announced_date:
-        tier25_reverse_stmt = (
-            select(Deal, PortfolioCompany)
-            .join(PortfolioCompany, Deal.company_id == PortfolioCompany.id)
-            .where(Deal.round_type == round_type)
-            .where(Deal.announced_date.is_(None))
-            .where(Deal.created_at >= (datetime.now(timezone.utc) - timedelta(days=30)).replace(tzinfo=None))
-        )
-        tier25_reverse_result = await session.execute(tier25_reverse_stmt)
-        tier25_reverse_candidates = tier25_reverse_result.all()
-
-        for deal, company in tier25_reverse_candidates:
-            if company_names_match(company_name, company.name):
-                # FIX (2026-01): Apply same stricter amount sanity check
-                if normalized_amount and deal.amount_usd:
-                    larger_amount = max(normalized_amount, deal.amount_usd)
-                    smaller_amount = min(normalized_amount, deal.amount_usd)
-                    ratio = larger_amount / max(1, smaller_amount)
-                    is_valuation_pattern = (
-                        8.0 <= ratio <= 12.0 and
-                        smaller_amount >= 50_000_000 and
-                        larger_amount >= 400_000_000
-                    )
-                    if ratio > 5 and not is_valuation_pattern:
-                        logger.debug(
-                            f"TIER 2.5 reverse skip: '{company_name}' amount ratio {ratio:.1f}x too high"
-                        )
-                        continue
-                logger.warning(
-                    f"Found duplicate (TIER 2.5 reverse): '{company_name}' {round_type} "
-                    f"matches '{company.name}' {deal.round_type} (deal #{deal.id}, "
-                    f"amounts: incoming={amount}, existing={deal.amount}, "
-                    f"dates: incoming={announced_date}, existing=NULL) "
-                    f"- existing deal has NULL date, incoming has date"
-                )
-                return deal
-
     # =========================================================================
     # TIER 1: General query for strict round match
     # FIX: Add round_type filter at SQL level to avoid LIMIT 200 missing duplicates
     # =========================================================================
     stmt = (
-        select(Deal, PortfolioCompany)
-        .join(PortfolioCompany, Deal.company_id == PortfolioCompany.id)
+        _DEAL_WITH_COMPANY_SELECT
         .where(Deal.round_type == round_type)
     )
 
@@ -1185,7 +1227,7 @@ async def find_duplicate_deal(
     if announced_date:
         date_start = announced_date - timedelta(days=365)
         date_end = announced_date + timedelta(days=365)
-        recent_cutoff_dt = (datetime.now(timezone.utc) - timedelta(days=365)).replace(tzinfo=None)
+        recent_cutoff_dt = now - timedelta(days=365)
         stmt = stmt.where(
             or_(
                 Deal.announced_date.between(date_start, date_end),
@@ -1193,8 +1235,8 @@ async def find_duplicate_deal(
             )
         )
     else:
-        recent_cutoff = date.today() - timedelta(days=365)
-        recent_cutoff_dt = (datetime.now(timezone.utc) - timedelta(days=365)).replace(tzinfo=None)
+        recent_cutoff = today - timedelta(days=365)
+        recent_cutoff_dt = now - timedelta(days=365)
         stmt = stmt.where(
             or_(
                 Deal.announced_date >= recent_cutoff,
@@ -1209,7 +1251,7 @@ async def find_duplicate_deal(
 
     for deal, company in candidates:
         # Skip if company names don't match (required for TIER 1)
-        if not company_names_match(company_name, company.name):
+        if not _company_names_match_normalized(company_name, normalized_company, company.name):
             continue
 
         # TIER 1: Same round type + amount match
@@ -1217,8 +1259,8 @@ async def find_duplicate_deal(
             if normalized_amount and deal.amount:
                 existing_amount = normalize_amount(deal.amount)
                 if existing_amount:
-                    tolerance = max(normalized_amount, existing_amount) * 0.15
-                    if abs(normalized_amount - existing_amount) <= tolerance:
+                    # Within 15% of the larger amount (integer math, no float rounding)
+                    if abs(normalized_amount - existing_amount) * 100 <= max(normalized_amount, existing_amount) * 15:
                         logger.info(
                             f"Found duplicate deal (TIER 1): '{company_name}' matches '{company.name}' "
                             f"(deal #{deal.id}, {deal.round_type}, {deal.amount})"
@@ -6134,12 +6134,15 @@ async def run_dedup_migration(
             """))
             rows = result.fetchall()
 
-            for row in rows:
-                deal_id, company_name, round_type, announced_date = row
-                key = make_key(company_name, round_type, announced_date)
+            # Key all rows up front, then write them in one executemany round trip
+            updates = [
+                {"key": make_key(company_name, round_type, announced_date), "id": deal_id}
+                for deal_id, company_name, round_type, announced_date in rows
+            ]
+            if updates:
                 await session.execute(
                     text("UPDATE deals SET dedup_key = :key WHERE id = :id"),
-                    {"key": key, "id": deal_id}
+                    updates
                 )
             await session.commit()
             logger.info(f"Backfilled {len(rows)} deals with dedup_key")
@@ -6303,14 +6306,17 @@ async def run_amount_dedup_migration(
             """))
             rows = result.fetchall()
 
-            for row in rows:
-                deal_id, company_name, amount_usd, announced_date = row
-                key = make_amount_key(company_name, amount_usd, announced_date)
+            # Key all rows up front, then write them in one executemany round trip
+            updates = [
+                {"key": make_amount_key(company_name, amount_usd, announced_date), "id": deal_id}
+                for deal_id, company_name, amount_usd, announced_date in rows
+            ]
+            if updates:
                 await session.execute(
                     text("UPDATE deals SET amount_dedup_key = :key WHERE id = :id"),
-                    {"key": key, "id": deal_id}
+                    updates
                 )
-                backfilled += 1
+            backfilled = len(updates)
             await session.commit()
             logger.info(f"Backfilled {backfilled} deals with amount_dedup_key")
 
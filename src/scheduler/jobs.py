@@ -1392,7 +1392,7 @@ async def _process_external_articles_impl(
     skip_title_filter: bool = False,
 ) -> Dict[str, int]:
     """Internal implementation of process_external_articles (extracted for try/finally wrapper)."""
-    from ..analyst.extractor import extract_deal, EXTERNAL_SOURCE_NAMES, EXTERNAL_SOURCE_CONFIDENCE_THRESHOLD, get_extraction_stats
+    from ..analyst.extractor import extract_deal, EXTERNAL_SOURCE_NAMES, EXTERNAL_SOURCE_CONFIDENCE_THRESHOLD, get_extraction_stats, confidence_band
     from ..archivist.storage import save_deal
     from ..archivist.database import get_session
     from ..archivist.models import Article
@@ -1579,16 +1579,10 @@ async def _process_external_articles_impl(
                     return None
 
                 # Track confidence band distribution (for monitoring)
+                # Classify outside the lock; only the counter update needs it
+                band = confidence_band(extraction.confidence_score)
                 async with results_lock:
-                    conf = extraction.confidence_score
-                    if conf < 0.35:
-                        stats["confidence_bands"]["below_threshold"] += 1
-                    elif conf < 0.50:
-                        stats["confidence_bands"]["borderline"] += 1
-                    elif conf < 0.65:
-                        stats["confidence_bands"]["medium"] += 1
-                    else:
-                        stats["confidence_bands"]["high"] += 1
+                    stats["confidence_bands"][band] += 1
 
                 # Skip non-announcement extractions (background mentions)
                 if not extraction.is_new_announcement:
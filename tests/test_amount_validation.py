@@ -11,10 +11,6 @@ Tests will be skipped if imports fail.
 """
 
 import pytest
-import sys
-import os
-
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 # Import test helpers
 from tests.test_helpers import skip_no_archivist, can_import_archivist
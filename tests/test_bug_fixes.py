@@ -130,6 +130,28 @@ class TestAmountDedupKey:
         assert key is not None
         assert len(key) == 32
 
+    @pytest.mark.skipif(
+        SKIP_ARCHIVIST_TESTS,
+        reason="Python 3.9 compatibility issue with instructor library"
+    )
+    @pytest.mark.parametrize("amount,bucket", [
+        (250_000, 1),
+        (999_999, 3),
+        (1_000_000, 4),
+        (9_999_999, 8),
+        (10_000_000, 9),
+        (99_999_999, 13),
+        (100_000_000, 15),
+        (999_999_999, 23),
+        (1_000_000_000, 26),
+        (2_600_000_000, 29),
+    ])
+    def test_amount_bucket_boundaries(self, amount, bucket):
+        """Amount buckets are stable across tier boundaries."""
+        from src.archivist.storage import _amount_bucket
+
+        assert _amount_bucket(amount) == bucket
+
 
 # =============================================================================
 # Bug 18: Company name normalization tests
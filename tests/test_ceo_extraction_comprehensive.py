@@ -13,14 +13,9 @@ Tests will be skipped if imports fail.
 """
 
 import pytest
-import sys
-import os
 import time
 from unittest.mock import AsyncMock, patch, MagicMock
 
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-
 # Import test helpers
 from tests.test_helpers import skip_no_enrichment, can_import_enrichment
 
@@ -11,11 +11,6 @@ Tests will be skipped if imports fail.
 """
 
 import pytest
-import sys
-import os
-
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 # Import test helpers
 from tests.test_helpers import skip_no_enrichment, can_import_enrichment
@@ -11,9 +11,6 @@ Previously, this file had a standalone copy that could drift from the
 real implementation in extractor.py.
 """
 
-import sys
-sys.path.insert(0, '.')
-
 # Import the real function from extractor
 from src.analyst.extractor import _validate_company_in_text
 
@@ -22,22 +22,36 @@ from src.analyst.schemas import (
     LeadStatus,
     FounderInfo,
     ChainOfThought,
+    PenaltyBreakdown,
 )
 from src.config.settings import settings
 
 
+# Validated once at import; tests clone it instead of re-running full model validation.
+_PROTOTYPE_DEAL = DealExtraction(
+    startup_name="TestCorp",
+    round_label=RoundType.SERIES_A,
+    lead_investors=[],
+    participating_investors=[],
+    tracked_fund_is_lead=False,
+    reasoning=ChainOfThought(final_reasoning="Test reasoning"),
+    confidence_score=0.80,
+)
+
+
 def _make_deal(**kwargs) -> DealExtraction:
-    """Helper to create DealExtraction with required fields filled in."""
-    defaults = {
-        "startup_name": "TestCorp",
-        "round_label": RoundType.SERIES_A,
-        "lead_investors": [],
-        "participating_investors": [],
-        "tracked_fund_is_lead": False,
-        "reasoning": ChainOfThought(final_reasoning="Test reasoning"),
-    }
-    defaults.update(kwargs)
-    return DealExtraction(**defaults)
+    """Helper to create DealExtraction with required fields filled in.
+
+    Clones the prototype via model_copy (no revalidation). List fields are always
+    fresh so validators that reassign/mutate them never leak into the prototype.
+    """
+    overrides = {"lead_investors": [], "participating_investors": [], "founders": []}
+    overrides.update(kwargs)
+    return _PROTOTYPE_DEAL.model_copy(update=overrides)
+
+
+# Name suffixes for generating N hallucinated founders/investors in penalty tests
+_FAKE_NAME_SUFFIXES = ("Alpha", "Beta", "Gamma", "Delta", "Epsilon")
 
 
 # =============================================================================
@@ -80,6 +94,18 @@ class TestConfidenceThresholds:
             "to be above 'cannot verify' level"
         )
 
+    def test_module_hybrid_constants_match_settings(self):
+        """Extractor's frozen hybrid thresholds should mirror settings."""
+        from src.analyst.extractor import (
+            HYBRID_CONFIDENCE_MAX,
+            HYBRID_CONFIDENCE_MIN,
+            HYBRID_CONFIDENCE_MIN_EXTERNAL,
+        )
+
+        assert HYBRID_CONFIDENCE_MIN == settings.hybrid_confidence_min
+        assert HYBRID_CONFIDENCE_MIN_EXTERNAL == settings.hybrid_confidence_min_external
+        assert HYBRID_CONFIDENCE_MAX == settings.hybrid_confidence_max
+
     def test_standard_threshold_value(self):
         """Verify standard confidence threshold is 0.50."""
         assert settings.extraction_confidence_threshold == 0.50
@@ -148,49 +174,32 @@ class TestFounderHallucinationPenalty:
         # Confidence should be reduced
         assert result.confidence_score < 0.80
 
-    def test_founder_penalty_calculation(self):
+    @pytest.mark.parametrize("count,expected_penalty", [
+        (1, 0.03),
+        (2, 0.06),
+        (3, 0.09),
+        (4, 0.10),  # Capped
+        (5, 0.10),  # Capped
+    ])
+    def test_founder_penalty_calculation(self, count, expected_penalty):
         """Verify founder removal penalty: min(0.10, count * 0.03)."""
         from src.analyst.extractor import _validate_founders_in_text
 
-        # Create deal with 3 founders not in text
-        deal = _make_deal(
-            confidence_score=0.80,
-            founders=[
-                FounderInfo(name="Fake One Alpha", title="CEO"),
-                FounderInfo(name="Fake Two Beta", title="CTO"),
-                FounderInfo(name="Fake Three Gamma", title="CFO"),
-            ],
-        )
-        article_text = "TestCorp announced funding today."
-
-        result = _validate_founders_in_text(deal, article_text)
-
-        # Penalty = min(0.10, 3 * 0.03) = min(0.10, 0.09) = 0.09
-        expected_confidence = 0.80 - 0.09
-        assert abs(result.confidence_score - expected_confidence) < 0.001
-
-    def test_founder_penalty_capped_at_010(self):
-        """Founder removal penalty should be capped at 0.10."""
-        from src.analyst.extractor import _validate_founders_in_text
-
-        # Create deal with 5 founders not in text
+        # Create deal with `count` founders not in text
         deal = _make_deal(
             confidence_score=0.80,
             founders=[
-                FounderInfo(name="Fake One Alpha", title="CEO"),
-                FounderInfo(name="Fake Two Beta", title="CTO"),
-                FounderInfo(name="Fake Three Gamma", title="CFO"),
-                FounderInfo(name="Fake Four Delta", title="COO"),
-                FounderInfo(name="Fake Five Epsilon", title="VP"),
+                FounderInfo(name=f"Fake {suffix}", title="CEO")
+                for suffix in _FAKE_NAME_SUFFIXES[:count]
             ],
         )
         article_text = "TestCorp announced funding today."
 
         result = _validate_founders_in_text(deal, article_text)
 
-        # Penalty = min(0.10, 5 * 0.03) = min(0.10, 0.15) = 0.10
-        expected_confidence = 0.80 - 0.10
-        assert abs(result.confidence_score - expected_confidence) < 0.001
+        assert len(result.founders) == 0
+        expected_confidence = 0.80 - expected_penalty
+        assert result.confidence_score == pytest.approx(expected_confidence, abs=1e-3)
 
 
 class TestInvestorHallucinationPenalty:
@@ -216,47 +225,32 @@ class TestInvestorHallucinationPenalty:
         # Confidence should be reduced
         assert result.confidence_score < 0.80
 
-    def test_investor_penalty_calculation(self):
+    @pytest.mark.parametrize("count,expected_penalty", [
+        (1, 0.05),
+        (2, 0.10),
+        (3, 0.15),
+        (4, 0.15),  # Capped
+        (5, 0.15),  # Capped
+    ])
+    def test_investor_penalty_calculation(self, count, expected_penalty):
         """Verify investor removal penalty: min(0.15, count * 0.05)."""
         from src.analyst.extractor import _validate_investors_in_text
 
-        # Create deal with 2 lead investors not in text
-        deal = _make_deal(
-            confidence_score=0.80,
-            lead_investors=[
-                InvestorMention(name="Fake Ventures One", role=LeadStatus.CONFIRMED_LEAD),
-                InvestorMention(name="Nonexistent Capital Two", role=LeadStatus.CONFIRMED_LEAD),
-            ],
-        )
-        article_text = "TestCorp announced funding today."
-
-        result = _validate_investors_in_text(deal, article_text)
-
-        # Penalty = min(0.15, 2 * 0.05) = min(0.15, 0.10) = 0.10
-        expected_confidence = 0.80 - 0.10
-        assert abs(result.confidence_score - expected_confidence) < 0.001
-
-    def test_investor_penalty_capped_at_015(self):
-        """Investor removal penalty should be capped at 0.15."""
-        from src.analyst.extractor import _validate_investors_in_text
-
-        # Create deal with 5 lead investors not in text
+        # Create deal with `count` lead investors not in text
         deal = _make_deal(
             confidence_score=0.80,
             lead_investors=[
-                InvestorMention(name="Fake Capital One", role=LeadStatus.CONFIRMED_LEAD),
-                InvestorMention(name="Fake Capital Two", role=LeadStatus.CONFIRMED_LEAD),
-                InvestorMention(name="Fake Capital Three", role=LeadStatus.CONFIRMED_LEAD),
-                InvestorMention(name="Fake Capital Four", role=LeadStatus.CONFIRMED_LEAD),
+                InvestorMention(name=f"Fake Capital {suffix}", role=LeadStatus.CONFIRMED_LEAD)
+                for suffix in _FAKE_NAME_SUFFIXES[:count]
             ],
         )
         article_text = "TestCorp announced funding today."
 
         result = _validate_investors_in_text(deal, article_text)
 
-        # Penalty = min(0.15, 4 * 0.05) = min(0.15, 0.20) = 0.15
-        expected_confidence = 0.80 - 0.15
-        assert abs(result.confidence_score - expected_confidence) < 0.001
+        assert len(result.lead_investors) == 0
+        expected_confidence = 0.80 - expected_penalty
+        assert result.confidence_score == pytest.approx(expected_confidence, abs=1e-3)
 
 
 # =============================================================================
@@ -286,7 +280,7 @@ class TestWeakEvidencePenalty:
         assert result.lead_evidence_weak == True
         # Confidence should be reduced by 0.08
         expected_confidence = 0.80 - 0.08
-        assert abs(result.confidence_score - expected_confidence) < 0.001
+        assert result.confidence_score == pytest.approx(expected_confidence, abs=1e-3)
 
     def test_weak_evidence_reduces_confidence_bad_snippet(self):
         """Snippet lacking lead language should reduce confidence by 0.08."""
@@ -309,7 +303,7 @@ class TestWeakEvidencePenalty:
         assert result.lead_evidence_weak == True
         # Confidence should be reduced by 0.08
         expected_confidence = 0.80 - 0.08
-        assert abs(result.confidence_score - expected_confidence) < 0.001
+        assert result.confidence_score == pytest.approx(expected_confidence, abs=1e-3)
 
 
 # =============================================================================
@@ -384,11 +378,10 @@ class TestHybridReextractionTriggers:
             (0.44, False),  # Below min - should NOT trigger
             (0.66, False),  # Above max - should NOT trigger
         ]
+        lo, hi = settings.hybrid_confidence_min, settings.hybrid_confidence_max
 
         for confidence, should_trigger in test_cases:
-            in_range = (
-                settings.hybrid_confidence_min <= confidence <= settings.hybrid_confidence_max
-            )
+            in_range = lo <= confidence <= hi
             assert in_range == should_trigger, (
                 f"Internal: Confidence {confidence} should{'not' if not should_trigger else ''} trigger reextraction"
             )
@@ -403,11 +396,10 @@ class TestHybridReextractionTriggers:
             (0.34, False),  # Below min - should NOT trigger
             (0.66, False),  # Above max - should NOT trigger
         ]
+        lo, hi = settings.hybrid_confidence_min_external, settings.hybrid_confidence_max
 
         for confidence, should_trigger in test_cases:
-            in_range = (
-                settings.hybrid_confidence_min_external <= confidence <= settings.hybrid_confidence_max
-            )
+            in_range = lo <= confidence <= hi
             assert in_range == should_trigger, (
                 f"External: Confidence {confidence} should{'not' if not should_trigger else ''} trigger reextraction"
             )
@@ -423,10 +415,11 @@ class TestHybridReextractionTriggers:
             (0.65, True, True, False),   # Not > 0.65 - handled by standard trigger
             (0.90, True, True, True),    # Very high confidence - should trigger
         ]
+        hi = settings.hybrid_confidence_max
 
         for confidence, weak_evidence, tracked_lead, should_trigger in test_cases:
             triggers_new_path = (
-                confidence > settings.hybrid_confidence_max
+                confidence > hi
                 and weak_evidence
                 and tracked_lead
             )
@@ -474,6 +467,22 @@ class TestConfidenceBands:
         # 0.65 = hybrid max
         assert 0.65 == settings.hybrid_confidence_max
 
+    @pytest.mark.parametrize("score,expected_band", [
+        (0.0, "below_threshold"),
+        (0.34, "below_threshold"),
+        (0.35, "borderline"),
+        (0.49, "borderline"),
+        (0.50, "medium"),
+        (0.64, "medium"),
+        (0.65, "high"),
+        (1.0, "high"),
+    ])
+    def test_confidence_band_lookup(self, score, expected_band):
+        """confidence_band() uses inclusive lower edges for each band."""
+        from src.analyst.extractor import confidence_band
+
+        assert confidence_band(score) == expected_band
+
 
 # =============================================================================
 # Integration Tests
@@ -514,7 +523,7 @@ class TestConfidenceScoringIntegration:
         # - Weak evidence: 0.08
         # Total: 0.11
         expected_confidence = 0.90 - 0.03 - 0.08
-        assert abs(result.confidence_score - expected_confidence) < 0.01
+        assert result.confidence_score == pytest.approx(expected_confidence, abs=1e-2)
 
     def test_validated_data_preserves_confidence(self):
         """Deals with all valid data should preserve original confidence."""
@@ -572,7 +581,7 @@ class TestSeparatedConfidenceFields:
 
         # extraction_confidence should be set to original value
         assert result.extraction_confidence == 0.80
-        assert result.penalty_breakdown == {}
+        assert result.penalty_breakdown == PenaltyBreakdown()
 
         # Now apply founder validation (penalty)
         result = _validate_founders_in_text(result, article_text)
@@ -602,8 +611,7 @@ class TestSeparatedConfidenceFields:
         result = _validate_founders_in_text(result, article_text)
 
         assert result.penalty_breakdown is not None
-        assert "founders_removed" in result.penalty_breakdown
-        assert result.penalty_breakdown["founders_removed"] == 0.06  # 2 * 0.03
+        assert result.penalty_breakdown.founders_removed == 0.06  # 2 * 0.03
 
     def test_penalty_breakdown_tracks_investors(self):
         """penalty_breakdown should track investor removal penalty."""
@@ -625,8 +633,7 @@ class TestSeparatedConfidenceFields:
         result = _validate_investors_in_text(result, article_text)
 
         assert result.penalty_breakdown is not None
-        assert "investors_removed" in result.penalty_breakdown
-        assert result.penalty_breakdown["investors_removed"] == 0.10  # 2 * 0.05
+        assert result.penalty_breakdown.investors_removed == 0.10  # 2 * 0.05
 
     def test_penalty_breakdown_tracks_weak_evidence(self):
         """penalty_breakdown should track weak evidence penalty."""
@@ -650,8 +657,7 @@ class TestSeparatedConfidenceFields:
         result = _verify_tracked_fund(result, article_text)
 
         assert result.penalty_breakdown is not None
-        assert "weak_evidence" in result.penalty_breakdown
-        assert result.penalty_breakdown["weak_evidence"] == 0.08
+        assert result.penalty_breakdown.weak_evidence == 0.08
 
     def test_lead_evidence_score_strong_evidence(self):
         """lead_evidence_score should be 1.0 for explicit lead language."""
@@ -20,6 +20,8 @@ import hashlib
 import re
 from datetime import date
 
+HEX_DIGITS = frozenset('0123456789abcdef')
+
 
 # Copy of the functions to test (avoids import issues)
 def _normalize_company_name_for_dedup(name: str) -> str:
@@ -216,7 +218,7 @@ class TestDedupKeyGeneration:
         """Key should be 32-character MD5 hex digest."""
         key = make_dedup_key("Converge Bio", "series_a", date(2026, 1, 13))
         assert len(key) == 32
-        assert all(c in '0123456789abcdef' for c in key)
+        assert set(key) <= HEX_DIGITS
 
 
 class TestRaceConditionScenarios:
@@ -332,7 +334,7 @@ class TestAmountDedupKeyGeneration:
         """Key should be 32-character MD5 hex digest."""
         key = make_amount_dedup_key("Parloa", 350_000_000, date(2026, 1, 15))
         assert len(key) == 32
-        assert all(c in '0123456789abcdef' for c in key)
+        assert set(key) <= HEX_DIGITS
 
 
 class TestAdjacentBucketKeys:
@@ -373,7 +375,7 @@ class TestAdjacentBucketKeys:
         keys = get_adjacent_bucket_keys("TestCo", "series_a", date(2026, 1, 15))
         for key in keys:
             assert len(key) == 32
-            assert all(c in '0123456789abcdef' for c in key)
+            assert set(key) <= HEX_DIGITS
 
     def test_adjacent_keys_none_date(self):
         """Adjacent keys with None date should work with month buckets."""
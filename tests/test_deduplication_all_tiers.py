@@ -18,17 +18,21 @@ Tests will be skipped if imports fail.
 where two deals (Jan 1 and Jan 20, 19 days apart) weren't detected as duplicates.
 """
 
+import logging
 import pytest
-from datetime import date, datetime, timedelta, timezone
-from unittest.mock import AsyncMock, MagicMock, patch, call
+from datetime import date, datetime, timedelta
 from typing import List, Tuple, Optional
 
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 # Import test helpers
-from tests.test_helpers import skip_no_archivist, can_import_archivist
+from tests.test_helpers import (
+    skip_no_archivist,
+    can_import_archivist,
+    FakeDeal,
+    FakeCompany,
+    FakeResult,
+    FakeAsyncSession,
+    FAKE_DEAL_CREATED_AT,
+)
 
 # Skip entire module if archivist imports fail (Python 3.9 compatibility)
 pytestmark = [skip_no_archivist]
@@ -58,15 +62,12 @@ class BaseDeduplicationTest:
 
     @pytest.fixture
     def mock_session(self):
-        """Create a mock database session."""
-        session = AsyncMock()
-        return session
+        """Create a fake database session."""
+        return FakeAsyncSession()
 
     def create_mock_result(self, deals_list: List[Tuple]):
-        """Create a properly mocked result object for SQLAlchemy."""
-        mock_result = MagicMock()
-        mock_result.all = MagicMock(return_value=deals_list)
-        return mock_result
+        """Create a fake SQLAlchemy result holding the given (deal, company) rows."""
+        return FakeResult(deals_list)
 
     def create_mock_deal(
         self,
@@ -78,20 +79,16 @@ class BaseDeduplicationTest:
         announced_date: Optional[date],
         created_at: Optional[datetime] = None
     ) -> Tuple:
-        """Create a mock (deal, company) tuple."""
-        deal = MagicMock()
-        deal.id = deal_id
-        deal.round_type = round_type
-        deal.amount = amount
-        deal.amount_usd = amount_usd
-        deal.announced_date = announced_date
-        deal.created_at = created_at or datetime.now(timezone.utc).replace(tzinfo=None)
-
-        company = MagicMock()
-        company.id = deal_id
-        company.name = company_name
-
-        return (deal, company)
+        """Create a fake (deal, company) tuple."""
+        deal = FakeDeal(
+            id=deal_id,
+            round_type=round_type,
+            amount=amount,
+            amount_usd=amount_usd,
+            announced_date=announced_date,
+            created_at=created_at or FAKE_DEAL_CREATED_AT,
+        )
+        return (deal, FakeCompany(id=deal_id, name=company_name))
 
     def setup_sequential_results(self, mock_session, results_sequence: List[List[Tuple]]):
         """
@@ -299,46 +296,24 @@ class TestTier4(BaseDeduplicationTest):
         assert result is not None
 
     @pytest.mark.asyncio
-    async def test_tier4_no_match_amount_over_5_percent(self, mock_session):
-        """TIER 4 should NOT match when amount differs by >5%."""
-        mock_session.execute.return_value = self.create_mock_result([])
-
-        result = await find_duplicate_deal(
-            session=mock_session,
-            company_name="MEQ Probe",
-            round_type="seed",
-            amount="$6M",  # 20% more - exceeds 5% tolerance
-            announced_date=date(2026, 1, 10)
-        )
-
-        assert result is None
-
-    @pytest.mark.asyncio
-    async def test_tier4_no_match_different_date(self, mock_session):
-        """TIER 4 requires exact date match."""
-        mock_session.execute.return_value = self.create_mock_result([])
-
-        result = await find_duplicate_deal(
-            session=mock_session,
-            company_name="MEQ Probe",
-            round_type="seed",
-            amount="$5M",
-            announced_date=date(2026, 1, 11)  # Different date
-        )
-
-        assert result is None
-
-    @pytest.mark.asyncio
-    async def test_tier4_no_match_different_round(self, mock_session):
-        """TIER 4 requires same round type."""
+    @pytest.mark.parametrize("company_name,round_type,amount,announced_date", [
+        # 20% more - exceeds 5% tolerance
+        pytest.param("MEQ Probe", "seed", "$6M", date(2026, 1, 10), id="amount_over_5_percent"),
+        # TIER 4 requires exact date match
+        pytest.param("MEQ Probe", "seed", "$5M", date(2026, 1, 11), id="different_date"),
+        # TIER 4 requires same round type
+        pytest.param("MEQ Probe", "series_a", "$5M", date(2026, 1, 10), id="different_round"),
+    ])
+    async def test_tier4_no_match(self, mock_session, company_name, round_type, amount, announced_date):
+        """TIER 4 should NOT match when amount, date or round differs."""
         mock_session.execute.return_value = self.create_mock_result([])
 
         result = await find_duplicate_deal(
             session=mock_session,
-            company_name="MEQ Probe",
-            round_type="series_a",  # Different round
-            amount="$5M",
-            announced_date=date(2026, 1, 10)
+            company_name=company_name,
+            round_type=round_type,
+            amount=amount,
+            announced_date=announced_date
         )
 
         assert result is None
@@ -358,6 +333,9 @@ class TestTier4(BaseDeduplicationTest):
         )
 
         assert result is None
+        # "ai" is too short for any prefix match, so the TIER 4 query is never issued
+        # (TIER 0, 3, 2, 2.5, 1 only)
+        assert mock_session.execute.call_count == 5
 
     @pytest.mark.asyncio
     async def test_tier4_no_match_different_prefix(self, mock_session):
@@ -506,49 +484,26 @@ class TestTier3(BaseDeduplicationTest):
         assert result is not None
 
     @pytest.mark.asyncio
-    async def test_tier3_no_match_amount_over_10_percent(self, mock_session):
-        """TIER 3 should NOT match when amount differs by >10%."""
-        mock_session.execute.return_value = self.create_mock_result([])
-
-        result = await find_duplicate_deal(
-            session=mock_session,
-            company_name="CrossRound Inc",
-            round_type="series_a",
-            amount="$12M",  # 20% more than $10M - exceeds 10%
-            announced_date=date(2026, 1, 10)
-        )
-
-        assert result is None
-
-    @pytest.mark.asyncio
-    async def test_tier3_no_match_date_over_30_days(self, mock_session):
-        """TIER 3 should NOT match when date is >30 days apart."""
-        mock_session.execute.return_value = self.create_mock_result([])
-
-        result = await find_duplicate_deal(
-            session=mock_session,
-            company_name="CrossRound Inc",
-            round_type="series_a",
-            amount="$10M",
-            announced_date=date(2026, 3, 15)  # ~65 days later
-        )
-
-        assert result is None
-
-    @pytest.mark.asyncio
-    async def test_tier3_no_match_null_amount(self, mock_session):
-        """TIER 3 requires amount to match - null amounts skip this tier."""
+    @pytest.mark.parametrize("amount,announced_date", [
+        # 20% more than $10M - exceeds 10%
+        pytest.param("$12M", date(2026, 1, 10), id="amount_over_10_percent"),
+        # ~65 days later
+        pytest.param("$10M", date(2026, 3, 15), id="date_over_30_days"),
+        # TIER 3 is skipped when no amount, falls through to other tiers
+        pytest.param(None, date(2026, 1, 10), id="null_amount"),
+    ])
+    async def test_tier3_no_match(self, mock_session, amount, announced_date):
+        """TIER 3 should NOT match when amount or date window differs, or amount is missing."""
         mock_session.execute.return_value = self.create_mock_result([])
 
         result = await find_duplicate_deal(
             session=mock_session,
             company_name="CrossRound Inc",
             round_type="series_a",
-            amount=None,  # No amount
-            announced_date=date(2026, 1, 10)
+            amount=amount,
+            announced_date=announced_date
         )
 
-        # TIER 3 is skipped when no amount, falls through to other tiers
         assert result is None
 
 
@@ -583,7 +538,7 @@ class TestTier2(BaseDeduplicationTest):
             [],  # TIER 0
             [],  # TIER 4
             [],  # TIER 3
-            [existing],  # TIER 2 exact
+            [existing],  # TIER 2
         ])
 
         result = await find_duplicate_deal(
@@ -613,8 +568,7 @@ class TestTier2(BaseDeduplicationTest):
             [],  # TIER 0
             [],  # TIER 4
             [],  # TIER 3
-            [],  # TIER 2 exact
-            [existing],  # TIER 2 fuzzy
+            [existing],  # TIER 2 (fuzzy name pass)
         ])
 
         result = await find_duplicate_deal(
@@ -628,49 +582,26 @@ class TestTier2(BaseDeduplicationTest):
         assert result is not None
 
     @pytest.mark.asyncio
-    async def test_tier2_no_match_different_day(self, mock_session):
-        """TIER 2 requires exact date match."""
-        mock_session.execute.return_value = self.create_mock_result([])
-
-        result = await find_duplicate_deal(
-            session=mock_session,
-            company_name="SameDay Corp",
-            round_type="seed",
-            amount="$5M",
-            announced_date=date(2026, 1, 11)  # Different day
-        )
-
-        assert result is None
-
-    @pytest.mark.asyncio
-    async def test_tier2_no_match_different_company(self, mock_session):
-        """TIER 2 should NOT match different companies on same day."""
-        mock_session.execute.return_value = self.create_mock_result([])
-
-        result = await find_duplicate_deal(
-            session=mock_session,
-            company_name="Different Corp",  # Different company
-            round_type="seed",
-            amount="$5M",
-            announced_date=date(2026, 1, 10)
-        )
-
-        assert result is None
-
-    @pytest.mark.asyncio
-    async def test_tier2_null_date_skipped(self, mock_session):
-        """TIER 2 is skipped when no date provided."""
+    @pytest.mark.parametrize("company_name,announced_date", [
+        # TIER 2 requires exact date match
+        pytest.param("SameDay Corp", date(2026, 1, 11), id="different_day"),
+        # Different company on the same day
+        pytest.param("Different Corp", date(2026, 1, 10), id="different_company"),
+        # TIER 2 requires exact date, so it's skipped when no date provided
+        pytest.param("SameDay Corp", None, id="null_date_skipped"),
+    ])
+    async def test_tier2_no_match(self, mock_session, company_name, announced_date):
+        """TIER 2 should NOT match a different day or company, and is skipped without a date."""
         mock_session.execute.return_value = self.create_mock_result([])
 
         result = await find_duplicate_deal(
             session=mock_session,
-            company_name="SameDay Corp",
+            company_name=company_name,
             round_type="seed",
             amount="$5M",
-            announced_date=None  # No date
+            announced_date=announced_date
         )
 
-        # TIER 2 requires exact date, so it's skipped
         assert result is None
 
 
@@ -714,8 +645,7 @@ class TestTier25(BaseDeduplicationTest):
             [],  # TIER 0
             [],  # TIER 4
             [],  # TIER 3
-            [],  # TIER 2 exact
-            [],  # TIER 2 fuzzy
+            [],  # TIER 2
             [existing],  # TIER 2.5 (valuation pattern: 10x ratio, both > $50M)
             [],  # TIER 1 (not reached)
         ])
@@ -747,8 +677,7 @@ class TestTier25(BaseDeduplicationTest):
             [],  # TIER 0
             [],  # TIER 4
             [],  # TIER 3
-            [],  # TIER 2 exact
-            [],  # TIER 2 fuzzy
+            [],  # TIER 2
             [existing],  # TIER 2.5
         ])
 
@@ -783,8 +712,7 @@ class TestTier25(BaseDeduplicationTest):
             [],  # TIER 0 (dates 19 days apart > ±3 days)
             [],  # TIER 4 (no exact date match)
             [],  # TIER 3 (may fail if amount_usd is NULL)
-            [],  # TIER 2 exact (different dates)
-            [],  # TIER 2 fuzzy (different dates)
+            [],  # TIER 2 (different dates)
             [existing],  # TIER 2.5 (same round + ±30 days = CAUGHT!)
         ])
 
@@ -800,31 +728,22 @@ class TestTier25(BaseDeduplicationTest):
         assert result.id == 3110
 
     @pytest.mark.asyncio
-    async def test_tier25_no_match_different_round(self, mock_session):
-        """TIER 2.5 requires same round type."""
+    @pytest.mark.parametrize("round_type,announced_date", [
+        # TIER 2.5 requires same round type
+        pytest.param("series_d", date(2026, 1, 12), id="different_round"),
+        # 36 days from Jan 10 - exceeds 30
+        pytest.param("series_c", date(2026, 2, 15), id="date_over_30_days"),
+    ])
+    async def test_tier25_no_match(self, mock_session, round_type, announced_date):
+        """TIER 2.5 should NOT match a different round or a date >30 days apart."""
         mock_session.execute.return_value = self.create_mock_result([])
 
         result = await find_duplicate_deal(
             session=mock_session,
             company_name="Valuation Corp",
-            round_type="series_d",  # Different round
+            round_type=round_type,
             amount="$6.6B",
-            announced_date=date(2026, 1, 12)
-        )
-
-        assert result is None
-
-    @pytest.mark.asyncio
-    async def test_tier25_no_match_date_over_30_days(self, mock_session):
-        """TIER 2.5 should NOT match when date is >30 days apart."""
-        mock_session.execute.return_value = self.create_mock_result([])
-
-        result = await find_duplicate_deal(
-            session=mock_session,
-            company_name="Valuation Corp",
-            round_type="series_c",
-            amount="$6.6B",
-            announced_date=date(2026, 2, 15)  # 36 days from Jan 10 - exceeds 30
+            announced_date=announced_date
         )
 
         assert result is None
@@ -845,8 +764,7 @@ class TestTier25(BaseDeduplicationTest):
             [],  # TIER 0
             [],  # TIER 4
             [],  # TIER 3
-            [],  # TIER 2 exact
-            [],  # TIER 2 fuzzy
+            [],  # TIER 2
             [existing],  # TIER 2.5
         ])
 
@@ -860,6 +778,38 @@ class TestTier25(BaseDeduplicationTest):
 
         assert result is not None
 
+    @pytest.mark.asyncio
+    async def test_tier25_reverse_null_existing_date(self, mock_session):
+        """TIER 2.5 query also returns recent NULL-date deals (REVERSE), no extra round trip."""
+        existing = self.create_mock_deal(
+            deal_id=460,
+            company_name="Optimist",
+            round_type="seed",
+            amount="$4M",
+            amount_usd=4_000_000,
+            announced_date=None
+        )
+
+        self.setup_sequential_results(mock_session, [
+            [],  # TIER 0
+            [],  # TIER 4
+            [],  # TIER 3
+            [],  # TIER 2
+            [existing],  # TIER 2.5 (REVERSE candidate: existing has NULL date)
+        ])
+
+        result = await find_duplicate_deal(
+            session=mock_session,
+            company_name="Optimist",
+            round_type="seed",
+            amount="$4M",
+            announced_date=date(2026, 1, 22)
+        )
+
+        assert result is not None
+        assert result.id == 460
+        assert mock_session.execute.call_count == 5
+
     @pytest.mark.asyncio
     async def test_tier25_null_date_skipped(self, mock_session):
         """TIER 2.5 is skipped when no date provided."""
@@ -905,8 +855,7 @@ class TestTier1(BaseDeduplicationTest):
             [],  # TIER 0
             [],  # TIER 4
             [],  # TIER 3
-            [],  # TIER 2 exact
-            [],  # TIER 2 fuzzy
+            [],  # TIER 2
             [],  # TIER 2.5
             [existing],  # TIER 1
         ])
@@ -938,8 +887,7 @@ class TestTier1(BaseDeduplicationTest):
             [],  # TIER 0
             [],  # TIER 4
             [],  # TIER 3
-            [],  # TIER 2 exact
-            [],  # TIER 2 fuzzy
+            [],  # TIER 2
             [],  # TIER 2.5
             [existing],  # TIER 1
         ])
@@ -970,8 +918,7 @@ class TestTier1(BaseDeduplicationTest):
             [],  # TIER 0
             [],  # TIER 4
             [],  # TIER 3
-            [],  # TIER 2 exact
-            [],  # TIER 2 fuzzy
+            [],  # TIER 2
             [],  # TIER 2.5
             [existing],  # TIER 1
         ])
@@ -987,46 +934,24 @@ class TestTier1(BaseDeduplicationTest):
         assert result is not None
 
     @pytest.mark.asyncio
-    async def test_tier1_no_match_amount_over_15_percent(self, mock_session):
-        """TIER 1 should NOT match when amount differs by >15%."""
-        mock_session.execute.return_value = self.create_mock_result([])
-
-        result = await find_duplicate_deal(
-            session=mock_session,
-            company_name="Standard Corp",
-            round_type="series_a",
-            amount="$25M",  # 25% more than $20M - exceeds 15%
-            announced_date=date(2026, 1, 10)
-        )
-
-        assert result is None
-
-    @pytest.mark.asyncio
-    async def test_tier1_no_match_different_round(self, mock_session):
-        """TIER 1 requires same round type."""
-        mock_session.execute.return_value = self.create_mock_result([])
-
-        result = await find_duplicate_deal(
-            session=mock_session,
-            company_name="Standard Corp",
-            round_type="series_b",  # Different round
-            amount="$20M",
-            announced_date=date(2026, 1, 10)
-        )
-
-        assert result is None
-
-    @pytest.mark.asyncio
-    async def test_tier1_no_match_date_over_365_days(self, mock_session):
-        """TIER 1 should NOT match when date is >365 days apart."""
+    @pytest.mark.parametrize("round_type,amount,announced_date", [
+        # 25% more than $20M - exceeds 15%
+        pytest.param("series_a", "$25M", date(2026, 1, 10), id="amount_over_15_percent"),
+        # TIER 1 requires same round type
+        pytest.param("series_b", "$20M", date(2026, 1, 10), id="different_round"),
+        # >365 days ago
+        pytest.param("series_a", "$20M", date(2024, 1, 1), id="date_over_365_days"),
+    ])
+    async def test_tier1_no_match(self, mock_session, round_type, amount, announced_date):
+        """TIER 1 should NOT match when amount, round or date window differs."""
         mock_session.execute.return_value = self.create_mock_result([])
 
         result = await find_duplicate_deal(
             session=mock_session,
             company_name="Standard Corp",
-            round_type="series_a",
-            amount="$20M",
-            announced_date=date(2024, 1, 1)  # >365 days ago
+            round_type=round_type,
+            amount=amount,
+            announced_date=announced_date
         )
 
         assert result is None
@@ -1043,7 +968,7 @@ class TestTierOrdering(BaseDeduplicationTest):
     """
 
     @pytest.mark.asyncio
-    async def test_tier0_catches_before_tier1(self, mock_session):
+    async def test_tier0_catches_before_tier1(self, mock_session, caplog):
         """TIER 0 should catch duplicates before TIER 1 is checked."""
         existing = self.create_mock_deal(
             deal_id=100,
@@ -1057,24 +982,26 @@ class TestTierOrdering(BaseDeduplicationTest):
         # TIER 0 returns match immediately
         mock_session.execute.return_value = self.create_mock_result([existing])
 
-        result = await find_duplicate_deal(
-            session=mock_session,
-            company_name="Torq",
-            round_type="series_d",
-            amount="$140M",
-            announced_date=date(2026, 1, 11)
-        )
+        with caplog.at_level(logging.INFO, logger="src.archivist.storage"):
+            result = await find_duplicate_deal(
+                session=mock_session,
+                company_name="Torq",
+                round_type="series_d",
+                amount="$140M",
+                announced_date=date(2026, 1, 11)
+            )
 
         # Should match via TIER 0
         assert result is not None
         assert result.id == 100
+        assert "(TIER 0 " in caplog.text
 
         # Should have only called execute once (TIER 0)
         # Note: This verifies TIER 0 short-circuits before checking other tiers
         assert mock_session.execute.call_count == 1
 
     @pytest.mark.asyncio
-    async def test_tier4_catches_name_variations_before_tier3(self, mock_session):
+    async def test_tier4_catches_name_variations_before_tier3(self, mock_session, caplog):
         """
         TIER 4 should catch name variations before TIER 3's cross-round logic.
         Uses names with 60%+ prefix overlap (FIX 2026-01).
@@ -1094,16 +1021,18 @@ class TestTierOrdering(BaseDeduplicationTest):
             [existing],  # TIER 4
         ])
 
-        result = await find_duplicate_deal(
-            session=mock_session,
-            company_name="Acme Labs",  # "acme" prefix with 60%+ overlap
-            round_type="seed",
-            amount="$5M",
-            announced_date=date(2026, 1, 10)
-        )
+        with caplog.at_level(logging.INFO, logger="src.archivist.storage"):
+            result = await find_duplicate_deal(
+                session=mock_session,
+                company_name="Acme Labs",  # "acme" prefix with 60%+ overlap
+                round_type="seed",
+                amount="$5M",
+                announced_date=date(2026, 1, 10)
+            )
 
         assert result is not None
         assert result.id == 200
+        assert "(TIER 4 " in caplog.text
 
         # Should have stopped at TIER 4 (2 calls total)
         assert mock_session.execute.call_count == 2
@@ -1352,8 +1281,7 @@ class TestRealWorldScenarios(BaseDeduplicationTest):
             [],  # TIER 0
             [],  # TIER 4 (amount too different)
             [],  # TIER 3 (amount too different)
-            [],  # TIER 2 exact (different day)
-            [],  # TIER 2 fuzzy
+            [],  # TIER 2 (different day)
             [original],  # TIER 2.5 (same round + date within 30 days, 10x = valuation pattern)
             [],  # TIER 1 (not reached)
         ])
@@ -17,16 +17,18 @@ Tests will be skipped if imports fail.
 """
 
 import pytest
-import asyncio
 from datetime import date, datetime, timedelta, timezone
-from unittest.mock import AsyncMock, MagicMock, patch
-
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Import test helpers
-from tests.test_helpers import skip_no_archivist, can_import_archivist
+from tests.test_helpers import (
+    skip_no_archivist,
+    can_import_archivist,
+    FakeDeal,
+    FakeCompany,
+    FakeResult,
+    FakeAsyncSession,
+    FAKE_DEAL_CREATED_AT,
+)
 
 # Skip entire module if archivist imports fail (Python 3.9 compatibility)
 pytestmark = [skip_no_archivist]
@@ -122,31 +124,21 @@ class TestCompanyNamesMatch:
         assert company_names_match("OpenAI", "OpenAPI") is False
 
 
-class TestTier0Deduplication:
-    """
-    Test TIER 0 deduplication scenarios.
-
-    TIER 0 catches:
-    - Exact company name (case-insensitive)
-    - Same round type
-    - Date within ±3 days
-    """
+class BaseTier0Test:
+    """Shared fake session/result/deal factories for the TIER 0 test classes."""
 
     @pytest.fixture
     def mock_session(self):
-        """Create a mock database session with proper async handling."""
-        session = AsyncMock()
-        return session
+        """Create a fake database session (find_duplicate_deal only calls execute())."""
+        return FakeAsyncSession()
 
     def create_mock_result(self, deals_list):
-        """Create a properly mocked result object."""
-        mock_result = MagicMock()
-        mock_result.all = MagicMock(return_value=deals_list)
-        return mock_result
+        """Create a fake result object holding the given (deal, company) rows."""
+        return FakeResult(deals_list)
 
     @pytest.fixture
     def create_mock_deal(self):
-        """Factory to create mock deals."""
+        """Factory to create fake (deal, company) rows."""
         def _create(
             deal_id: int,
             company_name: str,
@@ -155,106 +147,73 @@ class TestTier0Deduplication:
             announced_date: date,
             created_at: datetime = None
         ):
-            deal = MagicMock()
-            deal.id = deal_id
-            deal.round_type = round_type
-            deal.amount = amount
-            deal.announced_date = announced_date
-            deal.created_at = created_at or datetime.now(timezone.utc).replace(tzinfo=None)
-
-            company = MagicMock()
-            company.id = deal_id  # Simplified
-            company.name = company_name
-
-            return (deal, company)
+            deal = FakeDeal(
+                id=deal_id,
+                round_type=round_type,
+                amount=amount,
+                amount_usd=None,
+                announced_date=announced_date,
+                created_at=created_at or FAKE_DEAL_CREATED_AT,
+            )
+            return (deal, FakeCompany(id=deal_id, name=company_name))
         return _create
 
-    @pytest.mark.asyncio
-    async def test_tier0_exact_match_same_date(self, mock_session, create_mock_deal):
-        """
-        TIER 0 should match: Same company + same round + same date.
-        Scenario: Protege Series A $30M on Jan 8 from two sources.
-        """
-        existing_deal = create_mock_deal(
-            deal_id=2784,
-            company_name="Protege",
-            round_type="series_a",
-            amount="$30 million",
-            announced_date=date(2026, 1, 8)
-        )
-
-        # Mock the query to return the existing deal
-        mock_result = self.create_mock_result([existing_deal])
-        mock_session.execute.return_value = mock_result
-
-        result = await find_duplicate_deal(
-            session=mock_session,
-            company_name="Protege",
-            round_type="series_a",
-            amount="$30M",
-            announced_date=date(2026, 1, 8)
-        )
-
-        # Should find the duplicate
-        assert result is not None
-        assert result.id == 2784
-
-    @pytest.mark.asyncio
-    async def test_tier0_match_date_1_day_apart(self, mock_session, create_mock_deal):
-        """
-        TIER 0 should match: Same company + same round + date 1 day apart.
-        Scenario: Torq Series D on Jan 11 vs Jan 12.
-        """
-        existing_deal = create_mock_deal(
-            deal_id=2884,
-            company_name="Torq",
-            round_type="series_d",
-            amount="$140 million",
-            announced_date=date(2026, 1, 11)
-        )
-
-        mock_result = self.create_mock_result([existing_deal])
-        mock_session.execute.return_value = mock_result
 
-        result = await find_duplicate_deal(
-            session=mock_session,
-            company_name="Torq",
-            round_type="series_d",
-            amount="$140M",
-            announced_date=date(2026, 1, 12)  # 1 day later
-        )
+class TestTier0Deduplication(BaseTier0Test):
+    """
+    Test TIER 0 deduplication scenarios.
 
-        assert result is not None
-        assert result.id == 2884
+    TIER 0 catches:
+    - Exact company name (case-insensitive)
+    - Same round type
+    - Date within ±3 days
+    """
 
     @pytest.mark.asyncio
-    async def test_tier0_match_date_3_days_apart(self, mock_session, create_mock_deal):
-        """
-        TIER 0 should match: Same company + same round + date 3 days apart.
-        This is the boundary of the ±3 day tolerance.
-        """
+    @pytest.mark.parametrize(
+        "deal_id, company_name, round_type, existing_amount, existing_date, amount, announced_date",
+        [
+            # Protege Series A $30M on Jan 8 from two sources
+            pytest.param(
+                2784, "Protege", "series_a", "$30 million", date(2026, 1, 8), "$30M", date(2026, 1, 8),
+                id="exact_match_same_date",
+            ),
+            # Torq Series D on Jan 11 vs Jan 12
+            pytest.param(
+                2884, "Torq", "series_d", "$140 million", date(2026, 1, 11), "$140M", date(2026, 1, 12),
+                id="date_1_day_apart",
+            ),
+            # Boundary of the ±3 day tolerance
+            pytest.param(
+                100, "TestCompany", "series_a", "$50M", date(2026, 1, 10), "$50M", date(2026, 1, 13),
+                id="date_3_days_apart",
+            ),
+        ],
+    )
+    async def test_tier0_match(
+        self, mock_session, create_mock_deal,
+        deal_id, company_name, round_type, existing_amount, existing_date, amount, announced_date,
+    ):
+        """TIER 0 should match: Same company + same round + date within tolerance."""
         existing_deal = create_mock_deal(
-            deal_id=100,
-            company_name="TestCompany",
-            round_type="series_a",
-            amount="$50M",
-            announced_date=date(2026, 1, 10)
+            deal_id=deal_id,
+            company_name=company_name,
+            round_type=round_type,
+            amount=existing_amount,
+            announced_date=existing_date
         )
+        mock_session.execute.return_value = self.create_mock_result([existing_deal])
 
-        mock_result = self.create_mock_result([existing_deal])
-        mock_session.execute.return_value = mock_result
-
-        # Test +3 days
         result = await find_duplicate_deal(
             session=mock_session,
-            company_name="TestCompany",
-            round_type="series_a",
-            amount="$50M",
-            announced_date=date(2026, 1, 13)  # 3 days later
+            company_name=company_name,
+            round_type=round_type,
+            amount=amount,
+            announced_date=announced_date
         )
 
         assert result is not None
-        assert result.id == 100
+        assert result.id == deal_id
 
     @pytest.mark.asyncio
     async def test_tier0_no_match_date_4_days_apart(self, mock_session, create_mock_deal):
@@ -429,37 +388,9 @@ class TestTier0Deduplication:
         assert result.id == 2784
 
 
-class TestTier0EdgeCases:
+class TestTier0EdgeCases(BaseTier0Test):
     """Test edge cases and potential bugs in TIER 0."""
 
-    @pytest.fixture
-    def mock_session(self):
-        session = AsyncMock()
-        return session
-
-    def create_mock_result(self, deals_list):
-        """Create a properly mocked result object."""
-        mock_result = MagicMock()
-        mock_result.all = MagicMock(return_value=deals_list)
-        return mock_result
-
-    @pytest.fixture
-    def create_mock_deal(self):
-        def _create(deal_id, company_name, round_type, amount, announced_date, created_at=None):
-            deal = MagicMock()
-            deal.id = deal_id
-            deal.round_type = round_type
-            deal.amount = amount
-            deal.announced_date = announced_date
-            deal.created_at = created_at or datetime.now(timezone.utc).replace(tzinfo=None)
-
-            company = MagicMock()
-            company.id = deal_id
-            company.name = company_name
-
-            return (deal, company)
-        return _create
-
     @pytest.mark.asyncio
     async def test_negative_date_difference(self, mock_session, create_mock_deal):
         """
@@ -588,39 +519,35 @@ class TestTier0EdgeCases:
         assert result is not None
 
 
-class TestTier0RealWorldScenarios:
+# Existing deals from the real-world duplicate reports. Immutable, so built once.
+TORQ_SERIES_D = (
+    FakeDeal(
+        id=2884, round_type="series_d", amount="$140 million", amount_usd=None,
+        announced_date=date(2026, 1, 11), created_at=FAKE_DEAL_CREATED_AT,
+    ),
+    FakeCompany(id=2884, name="Torq"),
+)
+PROTEGE_SERIES_A = (
+    FakeDeal(
+        id=2784, round_type="series_a", amount="$30 million", amount_usd=None,
+        announced_date=date(2026, 1, 8), created_at=FAKE_DEAL_CREATED_AT,
+    ),
+    FakeCompany(id=2784, name="Protege"),
+)
+BLUECOPA_SERIES_A = (
+    FakeDeal(
+        id=2888, round_type="series_a", amount="$7.5 million", amount_usd=None,
+        announced_date=date(2026, 1, 12), created_at=FAKE_DEAL_CREATED_AT,
+    ),
+    FakeCompany(id=2888, name="Bluecopa"),
+)
+
+
+class TestTier0RealWorldScenarios(BaseTier0Test):
     """Test real-world scenarios that caused duplicate issues."""
 
-    @pytest.fixture
-    def mock_session(self):
-        session = AsyncMock()
-        return session
-
-    def create_mock_result(self, deals_list):
-        """Create a properly mocked result object."""
-        mock_result = MagicMock()
-        mock_result.all = MagicMock(return_value=deals_list)
-        return mock_result
-
-    @pytest.fixture
-    def create_mock_deal(self):
-        def _create(deal_id, company_name, round_type, amount, announced_date, created_at=None):
-            deal = MagicMock()
-            deal.id = deal_id
-            deal.round_type = round_type
-            deal.amount = amount
-            deal.announced_date = announced_date
-            deal.created_at = created_at or datetime.now(timezone.utc).replace(tzinfo=None)
-
-            company = MagicMock()
-            company.id = deal_id
-            company.name = company_name
-
-            return (deal, company)
-        return _create
-
     @pytest.mark.asyncio
-    async def test_torq_duplicate_scenario(self, mock_session, create_mock_deal):
+    async def test_torq_duplicate_scenario(self, mock_session):
         """
         Real scenario: Torq had 3 duplicates from different sources.
         - Deal 2884: $140 million, Jan 11 (SecurityWeek)
@@ -629,15 +556,7 @@ class TestTier0RealWorldScenarios:
 
         With TIER 0, 2885 and 2886 should have been caught.
         """
-        existing_deal = create_mock_deal(
-            deal_id=2884,
-            company_name="Torq",
-            round_type="series_d",
-            amount="$140 million",
-            announced_date=date(2026, 1, 11)
-        )
-
-        mock_result = self.create_mock_result([existing_deal])
+        mock_result = self.create_mock_result([TORQ_SERIES_D])
         mock_session.execute.return_value = mock_result
 
         # Simulate article 2 (Globes - same day)
@@ -661,7 +580,7 @@ class TestTier0RealWorldScenarios:
         assert result2 is not None, "Should catch 1-day-later duplicate (Finsmes)"
 
     @pytest.mark.asyncio
-    async def test_protege_duplicate_scenario(self, mock_session, create_mock_deal):
+    async def test_protege_duplicate_scenario(self, mock_session):
         """
         Real scenario: Protege had 2 duplicates.
         - Deal 2784: $30 million, Jan 8 (Ventureburn)
@@ -669,15 +588,7 @@ class TestTier0RealWorldScenarios:
 
         With TIER 0, 2809 should have been caught.
         """
-        existing_deal = create_mock_deal(
-            deal_id=2784,
-            company_name="Protege",
-            round_type="series_a",
-            amount="$30 million",
-            announced_date=date(2026, 1, 8)
-        )
-
-        mock_result = self.create_mock_result([existing_deal])
+        mock_result = self.create_mock_result([PROTEGE_SERIES_A])
         mock_session.execute.return_value = mock_result
 
         result = await find_duplicate_deal(
@@ -692,21 +603,13 @@ class TestTier0RealWorldScenarios:
         assert result.id == 2784
 
     @pytest.mark.asyncio
-    async def test_bluecopa_duplicate_scenario(self, mock_session, create_mock_deal):
+    async def test_bluecopa_duplicate_scenario(self, mock_session):
         """
         Real scenario: Bluecopa had 2 duplicates.
         - Deal 2888: $7.5 million, Jan 12 (Source A)
         - Deal 2889: $7.5 million, Jan 12 (Source B)
         """
-        existing_deal = create_mock_deal(
-            deal_id=2888,
-            company_name="Bluecopa",
-            round_type="series_a",
-            amount="$7.5 million",
-            announced_date=date(2026, 1, 12)
-        )
-
-        mock_result = self.create_mock_result([existing_deal])
+        mock_result = self.create_mock_result([BLUECOPA_SERIES_A])
         mock_session.execute.return_value = mock_result
 
         result = await find_duplicate_deal(
@@ -721,331 +624,108 @@ class TestTier0RealWorldScenarios:
         assert result.id == 2888
 
 
-class TestTier0DoesNotOverMatch:
+class TestTier0DoesNotOverMatch(BaseTier0Test):
     """
     Test that TIER 0 doesn't cause false positives.
     It should NOT match legitimate different deals.
 
     CRITICAL: These tests ensure we don't accidentally block legitimate deals!
-    """
-
-    @pytest.fixture
-    def mock_session(self):
-        session = AsyncMock()
-        return session
-
-    def create_mock_result(self, deals_list):
-        """Create a properly mocked result object."""
-        mock_result = MagicMock()
-        mock_result.all = MagicMock(return_value=deals_list)
-        return mock_result
-
-    @pytest.fixture
-    def create_mock_deal(self):
-        def _create(deal_id, company_name, round_type, amount, announced_date, created_at=None):
-            deal = MagicMock()
-            deal.id = deal_id
-            deal.round_type = round_type
-            deal.amount = amount
-            deal.announced_date = announced_date
-            deal.created_at = created_at or datetime.now(timezone.utc).replace(tzinfo=None)
-
-            company = MagicMock()
-            company.id = deal_id
-            company.name = company_name
-
-            return (deal, company)
-        return _create
-
-    @pytest.mark.asyncio
-    async def test_different_round_same_week(self, mock_session, create_mock_deal):
-        """
-        Company can have Series A and then Series A Extension same week.
-        These are different deals even if dates are close.
-
-        Note: This relies on round_type being different (series_a vs series_a_extension).
-        """
-        # TIER 0 requires same round_type, so different rounds won't match
-        mock_result = self.create_mock_result([])
-        mock_session.execute.return_value = mock_result
-
-        result = await find_duplicate_deal(
-            session=mock_session,
-            company_name="Protege",
-            round_type="series_a_extension",  # Different from series_a
-            amount="$30M",
-            announced_date=date(2026, 1, 10)  # Same week as Jan 8
-        )
-
-        # Should NOT match - different round type
-        assert result is None
-
-    @pytest.mark.asyncio
-    async def test_same_company_different_year(self, mock_session, create_mock_deal):
-        """
-        Same company can raise same round type in different years.
-        TIER 0's ±3 day window should not match deals months apart.
-        """
-        mock_result = self.create_mock_result([])
-        mock_session.execute.return_value = mock_result
-
-        result = await find_duplicate_deal(
-            session=mock_session,
-            company_name="Torq",
-            round_type="series_d",
-            amount="$140M",
-            announced_date=date(2025, 1, 11)  # 1 year earlier
-        )
-
-        # Should NOT match - date way out of range
-        assert result is None
-
-    @pytest.mark.asyncio
-    async def test_similar_but_different_company(self, mock_session, create_mock_deal):
-        """
-        "Torq" and "Torque" are different companies.
-        TIER 0 requires EXACT name match.
-        """
-        mock_result = self.create_mock_result([])
-        mock_session.execute.return_value = mock_result
-
-        result = await find_duplicate_deal(
-            session=mock_session,
-            company_name="Torque",  # Different from "Torq"
-            round_type="series_d",
-            amount="$140M",
-            announced_date=date(2026, 1, 11)
-        )
-
-        # Should NOT match - different company name
-        assert result is None
-
-    @pytest.mark.asyncio
-    async def test_seed_then_series_a_same_company(self, mock_session, create_mock_deal):
-        """
-        CRITICAL: Company raises Seed, then Series A a few days later.
-        These are DIFFERENT deals and should NOT be deduplicated!
-        """
-        mock_result = self.create_mock_result([])
-        mock_session.execute.return_value = mock_result
-
-        # Existing Seed round
-        # New Series A should NOT match
-        result = await find_duplicate_deal(
-            session=mock_session,
-            company_name="NewStartup",
-            round_type="series_a",  # Different from seed
-            amount="$20M",
-            announced_date=date(2026, 1, 12)  # Days after seed
-        )
-
-        assert result is None, "Series A should NOT be blocked by existing Seed"
-
-    @pytest.mark.asyncio
-    async def test_series_a_then_series_b_same_company(self, mock_session, create_mock_deal):
-        """
-        CRITICAL: Company raises Series A, then Series B.
-        These are DIFFERENT deals!
-        """
-        mock_result = self.create_mock_result([])
-        mock_session.execute.return_value = mock_result
-
-        result = await find_duplicate_deal(
-            session=mock_session,
-            company_name="GrowingStartup",
-            round_type="series_b",  # Different from series_a
-            amount="$50M",
-            announced_date=date(2026, 1, 15)
-        )
-
-        assert result is None, "Series B should NOT be blocked by existing Series A"
-
-    @pytest.mark.asyncio
-    async def test_different_companies_same_round_same_day(self, mock_session, create_mock_deal):
-        """
-        CRITICAL: Two different companies announce same round type on same day.
-        Common scenario: Multiple startups announce Series A on the same day.
-        """
-        mock_result = self.create_mock_result([])
-        mock_session.execute.return_value = mock_result
 
-        result = await find_duplicate_deal(
-            session=mock_session,
-            company_name="StartupB",  # Different from StartupA
-            round_type="series_a",
-            amount="$30M",
-            announced_date=date(2026, 1, 10)  # Same day
-        )
-
-        assert result is None, "Different company should NOT be blocked"
-
-    @pytest.mark.asyncio
-    async def test_company_name_substring_no_match(self, mock_session, create_mock_deal):
-        """
-        CRITICAL: "Air" should NOT match "Airbnb".
-        TIER 0 requires EXACT match, not substring.
-        """
-        mock_result = self.create_mock_result([])
-        mock_session.execute.return_value = mock_result
-
-        result = await find_duplicate_deal(
-            session=mock_session,
-            company_name="Airbnb",  # Contains "Air" but is different
-            round_type="series_a",
-            amount="$100M",
-            announced_date=date(2026, 1, 10)
-        )
-
-        assert result is None, "Airbnb should NOT match Air"
-
-    @pytest.mark.asyncio
-    async def test_company_name_prefix_no_match(self, mock_session, create_mock_deal):
-        """
-        CRITICAL: "Open" should NOT match "OpenAI".
-        """
-        mock_result = self.create_mock_result([])
-        mock_session.execute.return_value = mock_result
-
-        result = await find_duplicate_deal(
-            session=mock_session,
-            company_name="OpenAI",
-            round_type="series_b",
-            amount="$500M",
-            announced_date=date(2026, 1, 10)
-        )
-
-        assert result is None, "OpenAI should NOT match Open"
-
-    @pytest.mark.asyncio
-    async def test_company_with_common_word_no_false_match(self, mock_session, create_mock_deal):
-        """
-        CRITICAL: "AI Health" should NOT match "AI Robotics".
-        Even though both start with "AI".
-        """
-        mock_result = self.create_mock_result([])
-        mock_session.execute.return_value = mock_result
-
-        result = await find_duplicate_deal(
-            session=mock_session,
-            company_name="AI Robotics",
-            round_type="seed",
-            amount="$5M",
-            announced_date=date(2026, 1, 10)
-        )
-
-        assert result is None, "AI Robotics should NOT match AI Health"
-
-    @pytest.mark.asyncio
-    async def test_bridge_round_not_confused_with_series(self, mock_session, create_mock_deal):
-        """
-        CRITICAL: Bridge round should NOT match Series A.
-        """
-        mock_result = self.create_mock_result([])
-        mock_session.execute.return_value = mock_result
-
-        result = await find_duplicate_deal(
-            session=mock_session,
-            company_name="StartupX",
-            round_type="bridge",  # Different from series_a
-            amount="$5M",
-            announced_date=date(2026, 1, 12)
-        )
-
-        assert result is None, "Bridge should NOT match Series A"
-
-    @pytest.mark.asyncio
-    async def test_debt_round_not_confused_with_equity(self, mock_session, create_mock_deal):
-        """
-        CRITICAL: Debt round should NOT match equity rounds.
-        """
-        mock_result = self.create_mock_result([])
-        mock_session.execute.return_value = mock_result
-
-        result = await find_duplicate_deal(
-            session=mock_session,
-            company_name="StartupY",
-            round_type="debt",  # Different from series_a
-            amount="$20M",
-            announced_date=date(2026, 1, 12)
-        )
-
-        assert result is None, "Debt should NOT match Series A"
-
-    @pytest.mark.asyncio
-    async def test_growth_round_not_confused_with_series(self, mock_session, create_mock_deal):
-        """
-        CRITICAL: Growth round should NOT match series rounds.
-        """
-        mock_result = self.create_mock_result([])
-        mock_session.execute.return_value = mock_result
-
-        result = await find_duplicate_deal(
-            session=mock_session,
-            company_name="ScaleUp",
-            round_type="growth",
-            amount="$100M",
-            announced_date=date(2026, 1, 12)
-        )
-
-        assert result is None, "Growth should NOT match Series"
-
-    @pytest.mark.asyncio
-    async def test_pre_seed_not_confused_with_seed(self, mock_session, create_mock_deal):
-        """
-        CRITICAL: Pre-seed should NOT match seed.
-        """
-        mock_result = self.create_mock_result([])
-        mock_session.execute.return_value = mock_result
-
-        result = await find_duplicate_deal(
-            session=mock_session,
-            company_name="EarlyStartup",
-            round_type="pre_seed",
-            amount="$2M",
-            announced_date=date(2026, 1, 12)
-        )
-
-        assert result is None, "Pre-seed should NOT match Seed"
-
-    @pytest.mark.asyncio
-    async def test_date_boundary_4_days_no_match(self, mock_session, create_mock_deal):
-        """
-        CRITICAL: 4 days apart should NOT be matched by TIER 0.
-        This tests the exact boundary of the ±3 day tolerance.
-        """
-        mock_result = self.create_mock_result([])
-        mock_session.execute.return_value = mock_result
-
-        # Existing deal on Jan 10, new deal on Jan 14 (4 days later)
-        result = await find_duplicate_deal(
-            session=mock_session,
-            company_name="BoundaryTest",
-            round_type="series_a",
-            amount="$25M",
-            announced_date=date(2026, 1, 14)  # 4 days from Jan 10
-        )
-
-        assert result is None, "4 days apart should NOT match (TIER 0 is ±3 days)"
+    Every case runs find_duplicate_deal against empty candidate results (the SQL
+    filters exclude the existing deal); the ids name the scenario being guarded.
+    """
 
     @pytest.mark.asyncio
-    async def test_legitimate_follow_on_round(self, mock_session, create_mock_deal):
-        """
-        CRITICAL: Company can have legitimate follow-on in same round type.
-        E.g., Series A in Jan, then Series A-2 extension in Feb.
-        Different round_type naming prevents false match.
-        """
-        mock_result = self.create_mock_result([])
-        mock_session.execute.return_value = mock_result
-
-        result = await find_duplicate_deal(
-            session=mock_session,
-            company_name="FollowOnCo",
-            round_type="series_a_2",  # Extension naming
-            amount="$15M",
-            announced_date=date(2026, 2, 15)  # Month later
-        )
-
-        assert result is None, "Series A-2 should NOT match Series A"
+    @pytest.mark.parametrize("company_name, round_type, amount, announced_date, reason", [
+        pytest.param(
+            "Protege", "series_a_extension", "$30M", date(2026, 1, 10),
+            "Series A Extension same week as Series A is a different deal",
+            id="different_round_same_week",
+        ),
+        pytest.param(
+            "Torq", "series_d", "$140M", date(2025, 1, 11),
+            "Same round a year earlier is out of TIER 0's date window",
+            id="same_company_different_year",
+        ),
+        pytest.param(
+            "Torque", "series_d", "$140M", date(2026, 1, 11),
+            "Torque is not Torq - TIER 0 requires an exact name",
+            id="similar_but_different_company",
+        ),
+        pytest.param(
+            "NewStartup", "series_a", "$20M", date(2026, 1, 12),
+            "Series A should NOT be blocked by existing Seed",
+            id="seed_then_series_a_same_company",
+        ),
+        pytest.param(
+            "GrowingStartup", "series_b", "$50M", date(2026, 1, 15),
+            "Series B should NOT be blocked by existing Series A",
+            id="series_a_then_series_b_same_company",
+        ),
+        pytest.param(
+            "StartupB", "series_a", "$30M", date(2026, 1, 10),
+            "Different company should NOT be blocked",
+            id="different_companies_same_round_same_day",
+        ),
+        pytest.param(
+            "Airbnb", "series_a", "$100M", date(2026, 1, 10),
+            "Airbnb should NOT match Air",
+            id="company_name_substring_no_match",
+        ),
+        pytest.param(
+            "OpenAI", "series_b", "$500M", date(2026, 1, 10),
+            "OpenAI should NOT match Open",
+            id="company_name_prefix_no_match",
+        ),
+        pytest.param(
+            "AI Robotics", "seed", "$5M", date(2026, 1, 10),
+            "AI Robotics should NOT match AI Health",
+            id="company_with_common_word_no_false_match",
+        ),
+        pytest.param(
+            "StartupX", "bridge", "$5M", date(2026, 1, 12),
+            "Bridge should NOT match Series A",
+            id="bridge_round_not_confused_with_series",
+        ),
+        pytest.param(
+            "StartupY", "debt", "$20M", date(2026, 1, 12),
+            "Debt should NOT match Series A",
+            id="debt_round_not_confused_with_equity",
+        ),
+        pytest.param(
+            "ScaleUp", "growth", "$100M", date(2026, 1, 12),
+            "Growth should NOT match Series",
+            id="growth_round_not_confused_with_series",
+        ),
+        pytest.param(
+            "EarlyStartup", "pre_seed", "$2M", date(2026, 1, 12),
+            "Pre-seed should NOT match Seed",
+            id="pre_seed_not_confused_with_seed",
+        ),
+        pytest.param(
+            "BoundaryTest", "series_a", "$25M", date(2026, 1, 14),
+            "4 days apart should NOT match (TIER 0 is ±3 days)",
+            id="date_boundary_4_days_no_match",
+        ),
+        pytest.param(
+            "FollowOnCo", "series_a_2", "$15M", date(2026, 2, 15),
+            "Series A-2 should NOT match Series A",
+            id="legitimate_follow_on_round",
+        ),
+    ])
+    async def test_no_match(self, mock_session, company_name, round_type, amount, announced_date, reason):
+        """TIER 0 should not block a legitimately different deal."""
+        mock_session.execute.return_value = self.create_mock_result([])
+
+        result = await find_duplicate_deal(
+            session=mock_session,
+            company_name=company_name,
+            round_type=round_type,
+            amount=amount,
+            announced_date=announced_date
+        )
+
+        assert result is None, reason
 
 
 class TestTier0SQLQueryConstruction:
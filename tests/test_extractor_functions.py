@@ -361,6 +361,35 @@ class TestInvestorValidation:
         # "Sequoia" alone should also match
         assert _investor_in_text("Sequoia", article) == True
 
+    def test_accents_and_curly_quotes_folded(self):
+        """Accented and typographic variants should match their ASCII forms."""
+        from src.analyst.extractor import _fold_for_matching, _investor_in_text
+
+        assert _fold_for_matching("André O’Brien — Crème") == "andre o'brien - creme"
+        article = _fold_for_matching("The round was led by Élan Ventures.")
+        assert _investor_in_text("Elan Ventures", article)
+        assert _investor_in_text("Élan Ventures", article)
+
+    def test_accented_fund_alias_matches(self):
+        """Fund aliases should be folded the same way as the article text."""
+        from unittest.mock import patch
+
+        from src.analyst.extractor import (
+            _fold_for_matching,
+            _fund_alias_index,
+            _investor_in_text,
+        )
+
+        variants = {"creme": ["crème capital", "cc fund"]}
+        _fund_alias_index.cache_clear()
+        try:
+            with patch.dict("src.harvester.fund_matcher.FUND_NAME_VARIANTS", variants, clear=True):
+                article = _fold_for_matching("The round was led by Crème Capital.")
+                # Only the alias lookup can match: "cc fund" shares no word with the article
+                assert _investor_in_text("CC Fund", article)
+        finally:
+            _fund_alias_index.cache_clear()
+
 
 # =============================================================================
 # Lead Evidence Validation Tests
@@ -6,9 +6,16 @@ For pytest fixtures, see conftest.py.
 
 Usage:
     from tests.test_helpers import skip_py39, skip_no_archivist, can_import_archivist
+    from tests.test_helpers import FakeDeal, FakeCompany, FakeResult, FakeAsyncSession
+    from tests.test_helpers import FAKE_DEAL_CREATED_AT
 """
 
 import sys
+from dataclasses import dataclass
+from datetime import date, datetime
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
 import pytest
 
 
@@ -20,8 +27,10 @@ SKIP_PY310 = sys.version_info < (3, 11)
 
 
 # =============================================================================
-# Dependency checks
+# Dependency checks (cached: the skip markers below and each test module's
+# lazy-import guard all call these, and a failing import is retried otherwise)
 # =============================================================================
+@lru_cache(maxsize=1)
 def has_playwright():
     """Check if playwright is installed."""
     try:
@@ -31,6 +40,7 @@ def has_playwright():
         return False
 
 
+@lru_cache(maxsize=1)
 def has_postgres():
     """Check if asyncpg is installed (PostgreSQL driver)."""
     try:
@@ -40,6 +50,7 @@ def has_postgres():
         return False
 
 
+@lru_cache(maxsize=1)
 def has_instructor():
     """Check if instructor library is installed (for LLM extraction)."""
     try:
@@ -49,6 +60,7 @@ def has_instructor():
         return False
 
 
+@lru_cache(maxsize=1)
 def can_import_analyst():
     """Check if src.analyst can be imported (requires instructor + Python 3.10+)."""
     if SKIP_PY39:
@@ -60,6 +72,7 @@ def can_import_analyst():
         return False
 
 
+@lru_cache(maxsize=1)
 def can_import_harvester():
     """Check if src.harvester can be imported (may require playwright)."""
     try:
@@ -69,6 +82,7 @@ def can_import_harvester():
         return False
 
 
+@lru_cache(maxsize=1)
 def can_import_archivist():
     """Check if src.archivist can be imported (may require Python 3.10+)."""
     if SKIP_PY39:
@@ -80,6 +94,7 @@ def can_import_archivist():
         return False
 
 
+@lru_cache(maxsize=1)
 def can_import_enrichment():
     """Check if src.enrichment can be imported."""
     try:
@@ -138,6 +153,78 @@ skip_no_enrichment = pytest.mark.skipif(
 )
 
 
+# =============================================================================
+# find_duplicate_deal test doubles (plain objects instead of MagicMock/AsyncMock)
+# =============================================================================
+# Fixed created_at for fake deals: find_duplicate_deal only filters on created_at
+# in SQL, so the value never reaches an assertion and need not read the clock.
+FAKE_DEAL_CREATED_AT = datetime(2026, 1, 1)
+
+
+@dataclass(frozen=True, slots=True)
+class FakeDeal:
+    """Plain stand-in for a Deal row: only the attributes find_duplicate_deal reads."""
+    id: int
+    round_type: str
+    amount: Optional[str]
+    amount_usd: Optional[int]
+    announced_date: Optional[date]
+    created_at: datetime
+
+
+@dataclass(frozen=True, slots=True)
+class FakeCompany:
+    """Plain stand-in for a PortfolioCompany row."""
+    id: int
+    name: str
+
+
+class FakeResult:
+    """Result stand-in: find_duplicate_deal only ever calls .all() on it."""
+    __slots__ = ("_rows",)
+
+    def __init__(self, rows: List[Tuple]):
+        self._rows = rows
+
+    def all(self) -> List[Tuple]:
+        return self._rows
+
+
+class FakeExecute:
+    """
+    Async stand-in for AsyncMock().execute.
+
+    Supports the subset the tier tests use (return_value, side_effect list,
+    call_count) without AsyncMock's per-call MagicMock bookkeeping.
+    """
+
+    def __init__(self):
+        self.return_value = None
+        self.call_count = 0
+        self._side_effect = None
+
+    @property
+    def side_effect(self):
+        return self._side_effect
+
+    @side_effect.setter
+    def side_effect(self, results):
+        self._side_effect = iter(results) if results is not None else None
+
+    async def __call__(self, stmt, *args, **kwargs):
+        self.call_count += 1
+        if self._side_effect is not None:
+            return next(self._side_effect)
+        return self.return_value
+
+
+class FakeAsyncSession:
+    """Minimal AsyncSession double: find_duplicate_deal only calls execute()."""
+
+    def __init__(self):
+        self.execute = FakeExecute()
+
+
 # =============================================================================
 # Skip decorator for imports
 # =============================================================================